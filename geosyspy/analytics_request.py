@@ -0,0 +1,38 @@
+""" AnalyticsRequest class """
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class AnalyticsRequest:
+    """An analytics to run with `Geosys.run_analytics_batch()`.
+
+    Attributes:
+        kind (str): the analytics to run: "harvest", "emergence", "brazil_crop_id",
+            "potential_score", "greenness", "harvest_readiness", "planted_area" or "zarc"
+        params (dict): the arguments of the matching get_<kind>_analytics method,
+            except the geometry and the season field id
+        geometry (str): the geometry to calculate the analytic (WKT or GeoJSON)
+        season_field_id (Optional[str]): Optional season_field_id value
+    """
+
+    kind: str
+    params: dict
+    geometry: str
+    season_field_id: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class AnalyticsTask:
+    """A launched analytics processor, returned by `Geosys.launch_analytics()`.
+
+    Attributes:
+        task_id (str): the analytics processor task id
+        schema (str): the Analytics Fabric schema of its metrics
+        sf_unique_id (str): the season field unique id the metrics are attached to
+    """
+
+    task_id: str
+    schema: str
+    sf_unique_id: str
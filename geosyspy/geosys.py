@@ -1,32 +1,49 @@
 """ Geosysoy class"""
 
-import io
+import asyncio
 import logging
+import tempfile
+import time
 import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from functools import cached_property, reduce
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
-import rasterio
-import retrying
+import tenacity
 import xarray as xr
+from rasterio.enums import Resampling
 from rasterio.io import MemoryFile
+from rasterio.warp import reproject
 
 from geosyspy import image_reference
+from geosyspy.analytics_request import AnalyticsRequest, AnalyticsTask
 from geosyspy.services.agriquest_service import AgriquestService
 from geosyspy.services.analytics_fabric_service import AnalyticsFabricService
 from geosyspy.services.analytics_processor_service import AnalyticsProcessorService
 from geosyspy.services.gis_service import GisService
-from geosyspy.services.map_product_service import MapProductService
+from geosyspy.services.map_product_service import (
+    MapProductService,
+    TransientCoverageError,
+)
 from geosyspy.services.master_data_management_service import MasterDataManagementService
 from geosyspy.services.vegetation_time_series_service import VegetationTimeSeriesService
 from geosyspy.services.weather_service import WeatherService
 from geosyspy.utils.constants import (
+    DOWNLOAD_CHUNK_SIZE,
+    DOWNLOAD_MAX_WORKERS,
+    DOWNLOAD_SPOOL_MAX_SIZE,
+    HTTP_POOL_MAXSIZE,
     LR_SATELLITE_COLLECTION,
+    METRICS_CACHE_MAXSIZE,
+    METRICS_CACHE_TTL,
     MR_SATELLITE_COLLECTION,
+    MR_TIME_SERIES_DEFAULT_SENSORS,
     AgriquestBlocks,
     AgriquestCommodityCode,
     AgriquestWeatherType,
@@ -43,6 +60,78 @@ from geosyspy.utils.constants import (
 from geosyspy.utils.geosys_platform_urls import GEOSYS_API_URLS, GIS_API_URLS
 from geosyspy.utils.helper import Helper
 from geosyspy.utils.http_client import HttpClient
+from geosyspy.utils.lru_cache import LRUCache
+
+
+@dataclass(frozen=True)
+class _SeasonFieldAnalytics:
+    """How an analytics kind is launched on a season field.
+
+    Attributes:
+        launcher (str): the AnalyticsProcessorService method launching its processor
+        schema (str or callable): its metrics schema, or a function of the
+            analytics parameters returning it
+        enum_params (tuple): the Enum parameters sent to the processor by value
+        with_geometry (bool): whether the processor takes the WKT geometry
+        with_municipio (bool): whether the processor takes the Brazilian municipio id
+    """
+
+    launcher: str
+    schema: Union[str, Callable[[dict], str]]
+    enum_params: Tuple[str, ...] = ("crop",)
+    with_geometry: bool = True
+    with_municipio: bool = False
+
+
+_HARVEST_SCHEMAS = {Harvest.HARVEST_IN_SEASON: "INSEASON_HARVEST"}
+_EMERGENCE_SCHEMAS = {
+    Emergence.EMERGENCE_IN_SEASON: "INSEASON_EMERGENCE",
+    Emergence.EMERGENCE_HISTORICAL: "HISTORICAL_EMERGENCE",
+}
+
+# The analytics run on a season field, by AnalyticsRequest kind
+_SEASON_FIELD_ANALYTICS = {
+    "harvest": _SeasonFieldAnalytics(
+        "launch_harvest_processor",
+        lambda params: _HARVEST_SCHEMAS.get(params["harvest_type"], "HISTORICAL_HARVEST"),
+    ),
+    "emergence": _SeasonFieldAnalytics(
+        "launch_emergence_processor",
+        lambda params: _EMERGENCE_SCHEMAS.get(params["emergence_type"], "EMERGENCE_DELAY"),
+    ),
+    "brazil_crop_id": _SeasonFieldAnalytics(
+        "launch_brazil_in_season_crop_id_processor",
+        "CROP_IDENTIFICATION",
+        enum_params=("season",),
+    ),
+    "potential_score": _SeasonFieldAnalytics(
+        "launch_potential_score_processor", "POTENTIAL_SCORE"
+    ),
+    "greenness": _SeasonFieldAnalytics("launch_greenness_processor", "GREENNESS"),
+    "harvest_readiness": _SeasonFieldAnalytics(
+        "launch_harvest_readiness_processor", "HARVEST_READINESS"
+    ),
+    "planted_area": _SeasonFieldAnalytics(
+        "launch_planted_area_processor",
+        "PLANTED_AREA",
+        enum_params=(),
+        with_geometry=False,
+    ),
+    "zarc": _SeasonFieldAnalytics(
+        "launch_zarc_processor",
+        "ZARC",
+        enum_params=("crop", "cycle", "soil_type"),
+        with_geometry=False,
+        with_municipio=True,
+    ),
+}
+
+
+def _get_season_field_analytics(kind: str) -> _SeasonFieldAnalytics:
+    """Returns how an AnalyticsRequest kind is launched."""
+    if kind not in _SEASON_FIELD_ANALYTICS:
+        raise ValueError(f"Unknown analytics kind: {kind}")
+    return _SEASON_FIELD_ANALYTICS[kind]
 
 
 class Geosys:
@@ -82,24 +171,59 @@ class Geosys:
             enum_region.value,
             bearer_token,
         )
+        # The services holding state (season field, weather and download url
+        # caches, launches and task polls in progress) are created right away:
+        # they are used from worker threads, where two first accesses to a lazy
+        # property could each create their own instance.
         self.__master_data_management_service = MasterDataManagementService(
             self.base_url, self.http_client
         )
-        self.__analytics_fabric_service = AnalyticsFabricService(
-            self.base_url, self.http_client
-        )
         self.__analytics_processor_service = AnalyticsProcessorService(
             self.base_url, self.http_client
         )
-        self.__agriquest_service = AgriquestService(self.base_url, self.http_client)
         self.__weather_service = WeatherService(self.base_url, self.http_client)
-        self.__gis_service = GisService(self.gis_url, self.http_client)
-        self.__vts_service = VegetationTimeSeriesService(
-            self.base_url, self.http_client
-        )
         self.__map_product_service = MapProductService(
             self.base_url, self.http_client, self.priority_queue
         )
+        # Metrics of completed analytics tasks, by (task id, schema, season field
+        # unique id): checking the same task again within METRICS_CACHE_TTL
+        # seconds does not call the APIs again. Task ids are never reused, so the
+        # least recently used metrics are evicted past METRICS_CACHE_MAXSIZE.
+        self._metrics_cache = LRUCache(METRICS_CACHE_MAXSIZE)
+
+    def close(self):
+        """Closes the connections kept alive by the http client."""
+        self.http_client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+    # The stateless services are only instantiated the first time they are used.
+
+    @cached_property
+    def __analytics_fabric_service(self):
+        return AnalyticsFabricService(self.base_url, self.http_client)
+
+    @cached_property
+    def __agriquest_service(self):
+        return AgriquestService(self.base_url, self.http_client)
+
+    @cached_property
+    def __gis_service(self):
+        return GisService(self.gis_url, self.http_client)
+
+    @cached_property
+    def __vts_service(self):
+        return VegetationTimeSeriesService(self.base_url, self.http_client)
 
     def get_time_series(
         self,
@@ -139,29 +263,135 @@ class Geosys:
                 indicators,
             )
         if collection in LR_SATELLITE_COLLECTION:
-            if not season_field_id and not polygon:
-                raise ValueError(
-                    "Parameters 'season_field_id' and 'polygon' cannot be both None or empty."
-                )
-            if not season_field_id:
-                # extract seasonfield id from geometry
-                season_field_id = (
-                    self.__master_data_management_service.extract_season_field_id(
-                        polygon
-                    )
-                )
-            elif not self.__master_data_management_service.check_season_field_exists(
-                season_field_id
-            ):
-                raise ValueError(
-                    f"Cannot access {season_field_id}. It is not existing or connected user doesn't have access to it."
-                )
+            season_field_id = self.__get_time_series_season_field_id(
+                polygon, season_field_id
+            )
             return self.__vts_service.get_modis_time_series(
                 season_field_id, start_date, end_date, indicators[0]
             )
 
         raise ValueError(f"{collection} collection doesn't exist")
 
+    def __get_time_series_season_field_id(
+        self, polygon: Optional[str], season_field_id: Optional[str]
+    ) -> str:
+        """Returns the season field id of the polygon, or checks that the given
+        season field id is accessible to the connected user."""
+        if not season_field_id and not polygon:
+            raise ValueError(
+                "Parameters 'season_field_id' and 'polygon' cannot be both None or empty."
+            )
+        if not season_field_id:
+            # extract seasonfield id from geometry
+            return self.__master_data_management_service.extract_season_field_id(
+                polygon
+            )
+        if not self.__master_data_management_service.check_season_field_exists(
+            season_field_id
+        ):
+            raise ValueError(
+                f"Cannot access {season_field_id}. It is not existing or connected user doesn't have access to it."
+            )
+        return season_field_id
+
+    async def aget_time_series(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        collection: enumerate,
+        indicators: List[str],
+        polygon: Optional[str] = None,
+        season_field_id: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """Asynchronous version of `get_time_series`: the requests run in a worker
+        thread, so that the time series of several polygons or indicators can be
+        retrieved concurrently (e.g. with asyncio.gather)."""
+        return await asyncio.to_thread(
+            self.get_time_series,
+            start_date,
+            end_date,
+            collection,
+            indicators,
+            polygon,
+            season_field_id,
+        )
+
+    def get_time_series_batch(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        collection: enumerate,
+        indicators: List[str],
+        polygon: Optional[str] = None,
+        season_field_id: Optional[str] = None,
+    ) -> Dict[str, pd.DataFrame]:
+        """Retrieve the time series of several indicators for the aggregated polygon
+        on a low resolution collection. The season field is resolved once and the
+        indicators are requested concurrently.
+
+        This method can not be called from a running event loop (e.g. a notebook),
+        use `aget_time_series_batch` there.
+
+        Args:
+            start_date : The start date of the time series
+            end_date : The end date of the time series
+            collection : The low resolution collection targeted (e.g. MODIS)
+            indicators : The indicators to retrieve on the collection
+            polygon : (Optional) The polygon
+            season_field_id : Optional season_field_id to provide instead of polygon
+
+        Returns:
+            (dict): A pandas dataframe for the time series of each indicator
+
+        Raises:
+            ValueError: The collection is not a low resolution collection
+        """
+        return asyncio.run(
+            self.aget_time_series_batch(
+                start_date, end_date, collection, indicators, polygon, season_field_id
+            )
+        )
+
+    async def aget_time_series_batch(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        collection: enumerate,
+        indicators: List[str],
+        polygon: Optional[str] = None,
+        season_field_id: Optional[str] = None,
+    ) -> Dict[str, pd.DataFrame]:
+        """Asynchronous version of `get_time_series_batch`."""
+        # Weather fields are all returned by a single request of get_time_series.
+        if collection not in LR_SATELLITE_COLLECTION:
+            raise ValueError(
+                f"{collection} is not a low resolution collection, use get_time_series"
+            )
+        season_field_id = await asyncio.to_thread(
+            self.__get_time_series_season_field_id, polygon, season_field_id
+        )
+        semaphore = asyncio.Semaphore(HTTP_POOL_MAXSIZE)
+
+        async def get_time_series(indicator):
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self.__vts_service.get_modis_time_series,
+                    season_field_id,
+                    start_date,
+                    end_date,
+                    indicator,
+                )
+
+        unique_indicators = list(dict.fromkeys(indicators))
+        return dict(
+            zip(
+                unique_indicators,
+                await asyncio.gather(
+                    *(get_time_series(indicator) for indicator in unique_indicators)
+                ),
+            )
+        )
+
     def get_satellite_image_time_series(
         self,
         start_date: datetime,
@@ -170,6 +400,8 @@ class Geosys:
         indicators: List[str],
         polygon: Optional[str] = None,
         season_field_id: Optional[str] = None,
+        chunks: Optional[dict] = None,
+        output_zarr: Optional[str] = None,
     ):
         """Retrieve a pixel-by-pixel time series of the indicator on the collection targeted.
 
@@ -180,6 +412,12 @@ class Geosys:
             collections : The Satellite Imagery Collection targeted
             indicators : The indicators to retrieve on the collections
             season_field_id : Optional season_field_id to provide instead of polygon
+            chunks : Optional dask chunk sizes (e.g. {"x": 2048, "y": 2048}) of the
+                returned xarray dataset, so that downstream computations run chunk
+                by chunk. The images are still decoded in memory: use it with
+                output_zarr to not hold them all at once. Requires dask to be installed.
+            output_zarr : Optional path of a Zarr store the images are written to
+                one by one instead of being kept in memory. Requires zarr to be installed.
 
 
         Returns:
@@ -193,10 +431,18 @@ class Geosys:
 
         if not collections:
             return self.__get_images_as_dataset(
-                season_field_id, polygon, start_date, end_date, None, indicators[0]
+                season_field_id,
+                polygon,
+                start_date,
+                end_date,
+                None,
+                indicators[0],
+                chunks=chunks,
+                output_zarr=output_zarr,
             )
         elif all(isinstance(elem, SatelliteImageryCollection) for elem in collections):
-            if set(collections).issubset(set(LR_SATELLITE_COLLECTION)):
+            collections_set = set(collections)
+            if collections_set <= LR_SATELLITE_COLLECTION:
                 if not season_field_id:
                     # extract seasonfield id from geometry
                     season_field_id = (
@@ -216,7 +462,7 @@ class Geosys:
                 return self.__vts_service.get_time_series_by_pixel(
                     season_field_id, start_date, end_date, indicators[0]
                 )
-            elif set(collections).issubset(set(MR_SATELLITE_COLLECTION)):
+            elif collections_set <= MR_SATELLITE_COLLECTION:
                 return self.__get_images_as_dataset(
                     season_field_id,
                     polygon,
@@ -224,17 +470,43 @@ class Geosys:
                     end_date,
                     collections,
                     indicators[0],
+                    chunks=chunks,
+                    output_zarr=output_zarr,
                 )
         else:
             raise TypeError(
                 "Argument collections must be a list of SatelliteImageryCollection objects"
             )
 
-    @retrying.retry(
-        wait_exponential_multiplier=1000,
-        wait_exponential_max=10000,
-        stop_max_attempt_number=50,
-        retry_on_exception=lambda exc: isinstance(exc, ValueError),
+    async def aget_satellite_image_time_series(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        collections: Optional[list[SatelliteImageryCollection]],
+        indicators: List[str],
+        polygon: Optional[str] = None,
+        season_field_id: Optional[str] = None,
+        chunks: Optional[dict] = None,
+        output_zarr: Optional[str] = None,
+    ):
+        """Asynchronous version of `get_satellite_image_time_series`."""
+        return await asyncio.to_thread(
+            self.get_satellite_image_time_series,
+            start_date,
+            end_date,
+            collections,
+            indicators,
+            polygon,
+            season_field_id,
+            chunks,
+            output_zarr,
+        )
+
+    @tenacity.retry(
+        retry=tenacity.retry_if_exception_type(TransientCoverageError),
+        wait=tenacity.wait_exponential_jitter(initial=1, max=10),
+        stop=tenacity.stop_after_attempt(8),
+        reraise=True,
     )
     def get_satellite_coverage_image_references(
         self,
@@ -280,19 +552,45 @@ class Geosys:
             collections,
         )
         images_references = {}
-        if df is not None:
-            for i, image in df.iterrows():
-                images_references[(image["image.date"], image["image.sensor"])] = (
-                    image_reference.ImageReference(
-                        image["image.id"],
-                        image["image.date"],
-                        image["image.sensor"],
-                        image["seasonField.id"],
-                    )
+        # an empty coverage has no columns at all
+        if df is not None and not df.empty:
+            images_references = {
+                (image_date, image_sensor): image_reference.ImageReference(
+                    image_id, image_date, image_sensor, sf_id
+                )
+                for image_id, image_date, image_sensor, sf_id in zip(
+                    df["image.id"].to_numpy(),
+                    df["image.date"].to_numpy(),
+                    df["image.sensor"].to_numpy(),
+                    df["seasonField.id"].to_numpy(),
                 )
+            }
 
         return df, images_references
 
+    async def aget_satellite_coverage_image_references(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        collections: Optional[list[SatelliteImageryCollection]] = [
+            SatelliteImageryCollection.SENTINEL_2,
+            SatelliteImageryCollection.LANDSAT_8,
+        ],
+        polygon: Optional[str] = None,
+        season_field_id: Optional[str] = None,
+        coveragePercent: Optional[int] = 80,
+    ) -> tuple:
+        """Asynchronous version of `get_satellite_coverage_image_references`."""
+        return await asyncio.to_thread(
+            self.get_satellite_coverage_image_references,
+            start_date,
+            end_date,
+            collections,
+            polygon,
+            season_field_id,
+            coveragePercent,
+        )
+
     def download_image(self, polygon, image_id, indicator: str = "", path: str = ""):
         """Downloads a satellite image locally
 
@@ -303,14 +601,47 @@ class Geosys:
         """
 
         response_zipped_tiff = self.__map_product_service.get_zipped_tiff(
-            None, polygon, image_id, indicator
+            None, polygon, image_id, indicator, stream=True
         )
         if path == "":
             file_name = image_id.replace("|", "_")
             path = Path.cwd() / f"image_{file_name}_tiff.zip"
-        with open(path, "wb") as f:
-            self.logger.info("writing to %s", path)
-            f.write(response_zipped_tiff.content)
+        try:
+            with open(path, "wb") as f:
+                self.logger.info("writing to %s", path)
+                for chunk in response_zipped_tiff.iter_content(
+                    chunk_size=DOWNLOAD_CHUNK_SIZE
+                ):
+                    f.write(chunk)
+        finally:
+            response_zipped_tiff.close()
+
+    def download_images(
+        self, polygon, image_ids: List[str], indicator: str = "", path: str = ""
+    ):
+        """Downloads several satellite images locally, concurrently.
+
+        Args:
+            polygon: season field geometry
+            image_ids (List[str]): the image references to download
+            indicator (str): the indicator (NDVI...)
+            path (str): the directory to download the images to
+        """
+        directory = Path(path) if path != "" else Path.cwd()
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(
+                    self.download_image,
+                    polygon,
+                    image_id,
+                    indicator,
+                    directory / f"image_{image_id.replace('|', '_')}_tiff.zip",
+                )
+                for image_id in image_ids
+            ]
+        for future in futures:
+            # re-raises any download error
+            future.result()
 
     def download_image_difference_map(
         self, season_field_id, polygon, image_id_earliest, image_id_latest
@@ -346,6 +677,8 @@ class Geosys:
         collections: Optional[list[SatelliteImageryCollection]],
         indicator: str,
         coveragePercent: int = 80,
+        chunks: Optional[dict] = None,
+        output_zarr: Optional[str] = None,
     ) -> "np.ndarray[np.Any , np.dtype[np.float64]]":
         """Returns all the 'sensors_list' images covering 'polygon' between
         'start_date' and 'end_date' as a xarray dataset.
@@ -357,27 +690,43 @@ class Geosys:
             end_date : The date at which the method will stop looking images.
             collections : A list of Satellite Imagery Collection.
             indicator : A string representing the indicator whose time series the user wants.
+            chunks : Optional dask chunk sizes of the returned dataset.
+            output_zarr : Optional path of a Zarr store to write the images to.
 
         Returns:
             The image's numpy array.
 
         """
 
-        def get_coordinates_by_pixel(raster):
+        def get_coordinates_by_pixel(transform, height, width):
             """Returns the coordinates in meters in the raster's CRS
             from its pixels' grid coordinates."""
 
-            img = raster.read()
-            band1 = img[0]
-            height = band1.shape[0]
-            width = band1.shape[1]
-            cols, rows = np.meshgrid(np.arange(width), np.arange(height))
-            xs, ys = rasterio.transform.xy(raster.transform, rows, cols)
-            lons = np.array(xs)
-            lats = np.array(ys)
-            lst_lats = [lat[0] for lat in lats]
-            lst_lons = list(lons[0])
-            return {"y": lst_lats, "x": lst_lons}
+            # The affine transform is separable: the x coordinates only depend
+            # on the column on the first row and the y coordinates only on the
+            # row on the first column, so there is no need to build the whole
+            # (height, width) grid. Coordinates are the pixels' centers.
+            cols = np.arange(width) + 0.5
+            rows = np.arange(height) + 0.5
+            xs = transform.a * cols + transform.b * 0.5 + transform.c
+            ys = transform.d * 0.5 + transform.e * rows + transform.f
+            return {"y": ys, "x": xs}
+
+        def download_zip_archive(season_field_id, image_id):
+            """Streams the zipped tiff of an image into a temporary file,
+            kept in memory unless it is too large, and returns it rewound."""
+
+            response = self.__map_product_service.get_zipped_tiff(
+                season_field_id, polygon, image_id, indicator, stream=True
+            )
+            spooled_file = tempfile.SpooledTemporaryFile(
+                max_size=DOWNLOAD_SPOOL_MAX_SIZE
+            )
+            with response:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    spooled_file.write(chunk)
+            spooled_file.seek(0)
+            return spooled_file
 
         # Selects the covering images in the provided date range
         # and sorts them by resolution, from the highest to the lowest.
@@ -397,108 +746,247 @@ class Geosys:
             return xr.Dataset()
 
         df_coverage["image.date"] = pd.to_datetime(
-            df_coverage["image.date"], infer_datetime_format=True
+            df_coverage["image.date"], format="ISO8601"
         )
 
-        df_coverage = df_coverage.sort_values(
-            by=["image.spatialResolution", "image.date"], ascending=[True, True]
-        ).drop_duplicates(subset="image.date", keep="first")
-
-        # Creates a dictionary that contains a zip archive containing the tif file
-        # for each image id and some additional data (bands, sensor...)
-        dict_archives = {}
-        for i, row in df_coverage.iterrows():
-            if indicator.upper() != "REFLECTANCE":
-                bands = [indicator]
-            else:
-                bands = row["image.availableBands"]
-            dict_archives[row["image.id"]] = {
-                "byte_archive": self.__map_product_service.get_zipped_tiff(
-                    row["seasonField.id"], polygon, row["image.id"], indicator
-                ).content,
-                "bands": bands,
-                "date": row["image.date"],
-                "sensor": row["image.sensor"],
-            }
+        # Keeps the highest resolution image of each date (an image without
+        # resolution only if the date has no other), then sorts the kept
+        # images. The first image is the highest resolution one: it defines
+        # the dataset's grid.
+        df_coverage = (
+            df_coverage.sort_values(by=["image.date", "image.spatialResolution"])
+            .drop_duplicates(subset="image.date")
+            .sort_values(
+                by=["image.spatialResolution", "image.date"], ascending=[True, True]
+            )
+        )
 
-        # Extracts the tif files from  the zip archives in memory
-        # and transforms them into a list of xarray DataArrays.
-        # A list of all the raster's crs is also created in order
-        # to merge this data in the final xarray Dataset later on.
-        list_xarr = []
-        list_crs = []
         first_img_id = df_coverage.iloc[0]["image.id"]
-        for img_id, dict_data in dict_archives.items():
-            with zipfile.ZipFile(io.BytesIO(dict_data["byte_archive"]), "r") as archive:
-                images_in_bytes = [
-                    archive.read(file)
-                    for file in archive.namelist()
-                    if file.endswith(".tif")
+        # The first image is the highest resolution one: its grid is shared
+        # with the other images' workers once it is decoded.
+        first_grid = Future()
+
+        def decode_image(season_field_id, image_id):
+            """Downloads the zipped tiff of an image and decodes its rasters,
+            warped onto the first image's grid. Returns the list of the
+            decoded arrays with their crs."""
+
+            rasters = []
+            with download_zip_archive(
+                season_field_id, image_id
+            ) as zip_file, zipfile.ZipFile(zip_file, "r") as archive:
+                tif_files = [
+                    info for info in archive.infolist() if info.filename.endswith(".tif")
                 ]
-                for image in images_in_bytes:
-                    with MemoryFile(image) as memfile:
-                        with memfile.open() as raster:
-                            dict_coords = get_coordinates_by_pixel(raster)
-                            xarr = xr.DataArray(
-                                raster.read(masked=True),
-                                dims=["band", "y", "x"],
-                                coords={
-                                    "band": dict_data["bands"],
-                                    "y": dict_coords["y"],
-                                    "x": dict_coords["x"],
-                                    "time": dict_data["date"],
-                                },
-                            )
-
-                            if img_id == first_img_id:
-                                len_y = len(dict_coords["y"])
-                                len_x = len(dict_coords["x"])
+                for tif_file in tif_files:
+                    with archive.open(tif_file) as image, MemoryFile(
+                        image
+                    ) as memfile, memfile.open() as raster:
+                        # Decodes the raster once: the grid size is taken
+                        # from the decoded array rather than a second read.
+                        data = raster.read(masked=True)
+
+                        if image_id == first_img_id:
+                            if not first_grid.done():
+                                len_y, len_x = data.shape[1:]
                                 self.logger.info(
                                     "The highest resolution's image grid size is (%s,%s)",
                                     len_x,
                                     len_y,
                                 )
-                            else:
-                                self.logger.info(
-                                    "interpolating %s to %s's grid",
-                                    img_id,
-                                    first_img_id,
-                                )
-                                xarr = xarr.interp(
-                                    x=list_xarr[0].coords["x"].data,
-                                    y=list_xarr[0].coords["y"].data,
-                                    method="linear",
+                                first_grid.set_result(
+                                    {
+                                        "transform": raster.transform,
+                                        "crs": raster.crs,
+                                        "shape": (len_y, len_x),
+                                        "coords": get_coordinates_by_pixel(
+                                            raster.transform, len_y, len_x
+                                        ),
+                                    }
                                 )
-                            list_xarr.append(xarr)
-                            list_crs.append(raster.crs.to_string())
+                        else:
+                            grid = first_grid.result()
+                            self.logger.info(
+                                "interpolating %s to %s's grid",
+                                image_id,
+                                first_img_id,
+                            )
+                            # Warps the image onto the first image's grid
+                            # with GDAL, which also handles different CRS.
+                            source = data.astype(np.float64).filled(np.nan)
+                            data = np.full((data.shape[0], *grid["shape"]), np.nan)
+                            reproject(
+                                source=source,
+                                destination=data,
+                                src_transform=raster.transform,
+                                src_crs=raster.crs,
+                                src_nodata=np.nan,
+                                dst_transform=grid["transform"],
+                                dst_crs=grid["crs"],
+                                dst_nodata=np.nan,
+                                resampling=Resampling.bilinear,
+                            )
+                        rasters.append((data, raster.crs.to_string()))
+            return rasters
+
+        def release_first_grid(future):
+            """Fails the other images' workers waiting for the first image's
+            grid if the first image could not be decoded."""
+            if not first_grid.done():
+                first_grid.set_exception(
+                    future.exception()
+                    or ValueError(f"No tif file found for the image {first_img_id}")
+                )
+
+        # Images of different sensors may not have the same bands: they are
+        # all aligned on the union of their bands, like xarray's outer join.
+        list_bands = [
+            [indicator] if indicator.upper() != "REFLECTANCE" else available_bands
+            for available_bands in df_coverage["image.availableBands"]
+        ]
+        band_index = reduce(pd.Index.union, map(pd.Index, list_bands))
+
+        # Downloads, decodes and warps the images concurrently: each image is
+        # independent once the first image's grid is known, and GDAL releases
+        # the GIL while decoding. The decoded images are written in order
+        # into a single (time, band, y, x) array on the first image's grid,
+        # allocated once the first image is decoded. A list of all the
+        # raster's crs is also created in order to merge this data in the
+        # final xarray Dataset later on.
+        images = None
+        list_crs = []
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(decode_image, sf_id, image_id)
+                for sf_id, image_id in df_coverage[
+                    ["seasonField.id", "image.id"]
+                ].itertuples(index=False, name=None)
+            ]
+            futures[0].add_done_callback(release_first_grid)
+
+            for future, bands, (
+                img_id,
+                image_date,
+                image_sensor,
+                spatial_resolution,
+            ) in zip(
+                futures,
+                list_bands,
+                df_coverage[
+                    [
+                        "image.id",
+                        "image.date",
+                        "image.sensor",
+                        "image.spatialResolution",
+                    ]
+                ].itertuples(index=False, name=None),
+            ):
+                for data, crs in future.result():
+                    list_crs.append(crs)
+
+                    if output_zarr:
+                        grid = first_grid.result()
+                        # Aligns the image on the union of the bands, like the
+                        # in-memory dataset: the store has the full band axis
+                        # from the first write and the next images are
+                        # appended with their bands at the right positions.
+                        band_data = np.full((len(band_index), *data.shape[1:]), np.nan)
+                        band_data[band_index.get_indexer(bands)] = np.ma.filled(
+                            data.astype(np.float64, copy=False), np.nan
+                        )
+                        xarr = xr.DataArray(
+                            band_data,
+                            dims=["band", "y", "x"],
+                            coords={
+                                "band": list(band_index),
+                                "y": grid["coords"]["y"],
+                                "x": grid["coords"]["x"],
+                                "time": image_date,
+                            },
+                        )
+                        # Writes the image to the Zarr store right away
+                        # so that only a few images are held in memory. The
+                        # strings are variable-length (object) arrays and
+                        # the data float64, like the in-memory dataset, so
+                        # that the next images can be appended to the store.
+                        image_dataset = xr.Dataset(
+                            data_vars={
+                                indicator.lower(): xarr.expand_dims("time")
+                            }
+                        ).assign_coords(
+                            **{
+                                "image.id": (
+                                    "time",
+                                    np.array([img_id], dtype=object),
+                                ),
+                                "image.sensor": (
+                                    "time",
+                                    np.array([image_sensor], dtype=object),
+                                ),
+                                "image.spatialResolution": (
+                                    "time",
+                                    [spatial_resolution],
+                                ),
+                                "crs": (
+                                    "time",
+                                    np.array([crs], dtype=object),
+                                ),
+                            }
+                        )
+                        if len(list_crs) == 1:
+                            image_dataset.to_zarr(output_zarr, mode="w")
+                        else:
+                            image_dataset.to_zarr(output_zarr, append_dim="time")
+                    else:
+                        if images is None:
+                            images = np.full(
+                                (len(df_coverage), len(band_index), *data.shape[1:]),
+                                np.nan,
+                            )
+                        images[
+                            len(list_crs) - 1, band_index.get_indexer(bands)
+                        ] = np.ma.filled(data.astype(np.float64, copy=False), np.nan)
+
+        if output_zarr:
+            return xr.open_dataset(output_zarr, engine="zarr", chunks=chunks)
 
         # Adds the img's raster's crs to the initial dataframe
         df_coverage["crs"] = list_crs
 
-        # Concatenates all the DataArrays in list_xarr in order
-        # to create one final DataArray with an additional dimension
-        # 'time'. This final DataArray is then transformed into
-        # a xarray Dataset containing one data variable "reflectance".
-
-        final_xarr = xr.concat(list_xarr, "time")
-        dataset = xr.Dataset(data_vars={indicator.lower(): final_xarr})
+        # Wraps the images, which share the first image's grid and bands,
+        # without copying them into a xarray Dataset containing one data
+        # variable "reflectance".
+        dataset = xr.Dataset(
+            data_vars={
+                indicator.lower(): (
+                    ("time", "band", "y", "x"),
+                    images,
+                )
+            },
+            coords={
+                "time": df_coverage["image.date"].to_numpy(),
+                "band": band_index.to_numpy(),
+                **first_grid.result()["coords"],
+            },
+        )
 
         # Adds additional metadata to the dataset.
         dataset = dataset.assign_coords(
             **{
-                k: ("time", np.array(v))
-                for k, v in df_coverage[
-                    [
-                        "image.id",
-                        "image.sensor",
-                        "image.spatialResolution",
-                        "crs",
-                    ]
+                column: ("time", df_coverage[column].to_numpy())
+                for column in [
+                    "image.id",
+                    "image.sensor",
+                    "image.spatialResolution",
+                    "crs",
                 ]
-                .to_dict(orient="list")
-                .items()
             }
         )
+
+        # Backs the decoded dataset with dask arrays so that downstream
+        # computations (reductions over time...) run chunk by chunk.
+        if chunks:
+            dataset = dataset.chunk(chunks)
         return dataset
 
     ###########################################
@@ -569,6 +1057,19 @@ class Geosys:
             season_field_unique_id, schema_id, start_date, end_date
         )
 
+    async def aget_metrics(
+        self,
+        schema_id: str,
+        start_date: datetime,
+        end_date: datetime,
+        polygon: Optional[str] = None,
+        season_field_id: Optional[str] = None,
+    ):
+        """Asynchronous version of `get_metrics`."""
+        return await asyncio.to_thread(
+            self.get_metrics, schema_id, start_date, end_date, polygon, season_field_id
+        )
+
     def push_metrics(
         self,
         schema_id: str,
@@ -620,6 +1121,12 @@ class Geosys:
     #           MASTER DATA MANAGEMENT        #
     ###########################################
 
+    def clear_cache(self):
+        """Clears the cached season field lookups (season field ids extracted
+        from polygons, unique ids and existence checks) and analytics metrics."""
+        self.__master_data_management_service.clear_cache()
+        self._metrics_cache.clear()
+
     def get_available_crops(self):
         """Build the list of available crop codes for the connected user in an enum
 
@@ -681,7 +1188,7 @@ class Geosys:
                 geometry
             )
         )
-        ids = [item["id"] for item in result.json()]
+        ids = [item["id"] for item in self.http_client.json(result)]
         return ids
 
     def get_season_fields(self, season_field_ids: List[str]):
@@ -697,6 +1204,51 @@ class Geosys:
         )
         return result
 
+    def extract_season_field_ids(self, polygons: List[str]) -> List[str]:
+        """Extracts the season field id of several polygons at once, creating
+        the season fields that do not exist yet. The requests of the different
+        polygons run concurrently.
+
+        This method can not be called from a running event loop (e.g. a notebook),
+        use `aextract_season_field_ids` there.
+
+        Args:
+            polygons (List[str]): the polygons, as WKT
+
+        Returns:
+            The season field ids, in the polygons' order
+        """
+        return asyncio.run(self.aextract_season_field_ids(polygons))
+
+    async def aextract_season_field_ids(self, polygons: List[str]) -> List[str]:
+        """Asynchronous version of `extract_season_field_ids`.
+
+        Args:
+            polygons (List[str]): the polygons, as WKT
+
+        Returns:
+            The season field ids, in the polygons' order
+        """
+        # Each polygon is extracted once, with no more concurrent requests than
+        # the http client keeps connections alive.
+        semaphore = asyncio.Semaphore(HTTP_POOL_MAXSIZE)
+
+        async def extract(polygon):
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self.__master_data_management_service.extract_season_field_id,
+                    polygon,
+                )
+
+        unique_polygons = list(dict.fromkeys(polygons))
+        season_field_ids = dict(
+            zip(
+                unique_polygons,
+                await asyncio.gather(*(extract(polygon) for polygon in unique_polygons)),
+            )
+        )
+        return [season_field_ids[polygon] for polygon in polygons]
+
     ###########################################
     #           AGRIQUEST                     #
     ###########################################
@@ -765,8 +1317,42 @@ class Geosys:
     #           ANALYTICS PROCESSOR           #
     ###########################################
     def check_status_and_metrics(self, task_id, schema, sf_unique_id):
+        key = (task_id, schema, sf_unique_id)
+        metrics = self.__get_cached_metrics(key)
+        if metrics is not None:
+            return metrics
         self.__analytics_processor_service.wait_and_check_task_status(task_id)
-        return self.__analytics_fabric_service.get_lastest_metrics(sf_unique_id, schema)
+        metrics = self.__analytics_fabric_service.get_lastest_metrics(sf_unique_id, schema)
+        return self.__cache_metrics(key, metrics)
+
+    async def acheck_status_and_metrics(self, task_id, schema, sf_unique_id):
+        key = (task_id, schema, sf_unique_id)
+        metrics = self.__get_cached_metrics(key)
+        if metrics is not None:
+            return metrics
+        await self.__analytics_processor_service.await_task_status(task_id)
+        metrics = await asyncio.to_thread(
+            self.__analytics_fabric_service.get_lastest_metrics, sf_unique_id, schema
+        )
+        return self.__cache_metrics(key, metrics)
+
+    def __get_cached_metrics(self, key):
+        """Returns a copy of the cached metrics of a task, or None if they are
+        not cached or have expired."""
+        cached = self._metrics_cache.get(key)
+        if cached is None:
+            return None
+        expires_at, metrics = cached
+        if expires_at < time.monotonic():
+            self._metrics_cache.pop(key, None)
+            return None
+        return metrics.copy()
+
+    def __cache_metrics(self, key, metrics):
+        """Caches the metrics of a completed task; failed or empty fetches are not cached."""
+        if isinstance(metrics, pd.DataFrame) and not metrics.empty:
+            self._metrics_cache.set(key, (time.monotonic() + METRICS_CACHE_TTL, metrics.copy()))
+        return metrics
 
     def get_mr_time_series(
         self,
@@ -798,29 +1384,93 @@ class Geosys:
         Returns:
             string : s3 bucket path
         """
+        task_id = self.__launch_mr_time_series(
+            polygon,
+            start_date,
+            end_date,
+            list_sensors,
+            denoiser,
+            smoother,
+            eoc,
+            aggregation,
+            index,
+            raw_data,
+        )
+
+        # check the task status to continue or not the process
+        self.__analytics_processor_service.wait_and_check_task_status(task_id)
+
+        return self.__analytics_processor_service.get_s3_path_from_task_and_processor(
+            task_id, processor_name="mrts"
+        )
+
+    async def aget_mr_time_series(
+        self,
+        polygon,
+        start_date: str = "2010-01-01",
+        end_date=None,
+        list_sensors=None,
+        denoiser: bool = True,
+        smoother: str = "ww",
+        eoc: bool = True,
+        aggregation: str = "mean",
+        index: str = "ndvi",
+        raw_data: bool = False,
+    ):
+        """Asynchronous version of `get_mr_time_series`: the task status is
+        awaited without blocking the event loop.
+
+        Args:
+            start_date : The start date of the time series
+            end_date : The end date of the time series
+            list_sensors : The Satellite Imagery Collection targeted
+            denoiser : A boolean value indicating whether a denoising operation should be applied or not.
+            smoother : The type or name of the smoothing technique or algorithm to be used.
+            eoc : A boolean value indicating whether the "end of curve" detection should be performed.
+            func : The type or name of the function to be applied to the data.
+            index : The type or name of the index used for data manipulation or referencing
+            raw_data : A boolean value indicating whether the data is in its raw/unprocessed form.
+            polygon : A string representing a polygon.
+
+        Returns:
+            string : s3 bucket path
+        """
+        task_id = await asyncio.to_thread(
+            self.__launch_mr_time_series,
+            polygon,
+            start_date,
+            end_date,
+            list_sensors,
+            denoiser,
+            smoother,
+            eoc,
+            aggregation,
+            index,
+            raw_data,
+        )
+        await self.__analytics_processor_service.await_task_status(task_id)
+        return await asyncio.to_thread(
+            self.__analytics_processor_service.get_s3_path_from_task_and_processor,
+            task_id,
+            processor_name="mrts",
+        )
+
+    def __launch_mr_time_series(
+        self,
+        polygon,
+        start_date: str = "2010-01-01",
+        end_date=None,
+        list_sensors=None,
+        denoiser: bool = True,
+        smoother: str = "ww",
+        eoc: bool = True,
+        aggregation: str = "mean",
+        index: str = "ndvi",
+        raw_data: bool = False,
+    ):
+        """Launches the mr time series processor and returns its task id."""
         if list_sensors is None:
-            list_sensors = [
-                "micasense",
-                "sequoia",
-                "m4c",
-                "sentinel_2",
-                "landsat_8",
-                "landsat_9",
-                "cbers4",
-                "kazstsat",
-                "alsat_1b",
-                "huanjing_2",
-                "deimos",
-                "gaofen_1",
-                "gaofen_6",
-                "resourcesat2",
-                "dmc_2",
-                "landsat_5",
-                "landsat_7",
-                "spot",
-                "rapideye_3a",
-                "rapideye_1b",
-            ]
+            list_sensors = MR_TIME_SERIES_DEFAULT_SENSORS
         task_id = self.__analytics_processor_service.launch_mr_time_series_processor(
             start_date=start_date,
             end_date=end_date,
@@ -833,13 +1483,7 @@ class Geosys:
             index=index,
             eoc=eoc,
         )
-
-        # check the task status to continue or not the process
-        self.__analytics_processor_service.wait_and_check_task_status(task_id)
-
-        return self.__analytics_processor_service.get_s3_path_from_task_and_processor(
-            task_id, processor_name="mrts"
-        )
+        return task_id
 
     def get_harvest_analytics(
         self,
@@ -868,47 +1512,18 @@ class Geosys:
         Returns:
             A Pandas DataFrame containing several columns with metrics
         """
-        # validate and convert the geometry to WKT
-        geometry = Helper.convert_to_wkt(geometry)
-
-        if geometry is None:
-            raise ValueError("The geometry is not a valid WKT of GeoJson")
-
-        if not season_field_id:
-            # extract seasonfield id from geometry
-            season_field_id = (
-                self.__master_data_management_service.extract_season_field_id(geometry)
-            )
-
-        sf_unique_id = self.__master_data_management_service.get_season_field_unique_id(
-            season_field_id
-        )
-
-        task_id = self.__analytics_processor_service.launch_harvest_processor(
+        return self.__run_sf_analytics(
+            "harvest",
+            geometry,
+            season_field_id,
             season_duration=season_duration,
             season_start_day=season_start_day,
             season_start_month=season_start_month,
-            seasonfield_id=sf_unique_id,
-            geometry=geometry,
-            crop=crop.value,
+            crop=crop,
             year=year,
             harvest_type=harvest_type,
         )
 
-        self.logger.info("Task Id: %s", task_id)
-
-        # check the task status to continue or not the process
-        self.__analytics_processor_service.wait_and_check_task_status(task_id)
-
-        # Analytics Schema
-        if harvest_type == Harvest.HARVEST_IN_SEASON:
-            schema = "INSEASON_HARVEST"
-        else:
-            schema = "HISTORICAL_HARVEST"
-
-        # if task successfully completed, get metrics from analytics fabric
-        return self.__analytics_fabric_service.get_lastest_metrics(sf_unique_id, schema)
-
     def get_emergence_analytics(
         self,
         season_duration: int,
@@ -936,48 +1551,18 @@ class Geosys:
         Returns:
             A Pandas DataFrame containing several columns with metrics
         """
-        # validate and convert the geometry to WKT
-        geometry = Helper.convert_to_wkt(geometry)
-
-        if geometry is None:
-            raise ValueError("The geometry is not a valid WKT of GeoJson")
-
-        # Create seasonfield from geometry and extract uniqueId
-        if not season_field_id:
-            # extract seasonfield id from geometry
-            season_field_id = (
-                self.__master_data_management_service.extract_season_field_id(geometry)
-            )
-
-        sf_unique_id = self.__master_data_management_service.get_season_field_unique_id(
-            season_field_id
-        )
-
-        task_id = self.__analytics_processor_service.launch_emergence_processor(
+        return self.__run_sf_analytics(
+            "emergence",
+            geometry,
+            season_field_id,
             season_duration=season_duration,
             season_start_day=season_start_day,
             season_start_month=season_start_month,
-            seasonfield_id=sf_unique_id,
-            geometry=geometry,
-            crop=crop.value,
+            crop=crop,
             year=year,
             emergence_type=emergence_type,
         )
 
-        # check the task status to continue or not the process
-        self.__analytics_processor_service.wait_and_check_task_status(task_id)
-
-        # Analytics Schema
-        if emergence_type == Emergence.EMERGENCE_IN_SEASON:
-            schema = "INSEASON_EMERGENCE"
-        elif emergence_type == Emergence.EMERGENCE_HISTORICAL:
-            schema = "HISTORICAL_EMERGENCE"
-        else:
-            schema = "EMERGENCE_DELAY"
-
-        # if task successfully completed, get metrics from analytics fabric
-        return self.__analytics_fabric_service.get_lastest_metrics(sf_unique_id, schema)
-
     def get_brazil_crop_id_analytics(
         self,
         start_date: str,
@@ -998,32 +1583,13 @@ class Geosys:
         Returns:
             A Pandas DataFrame containing several columns with metrics
         """
-        # validate and convert the geometry to WKT
-        geometry = Helper.convert_to_wkt(geometry)
-
-        if geometry is None:
-            raise ValueError("The geometry is not a valid WKT of GeoJson")
-
-        if not season_field_id:
-            # extract seasonfield id from geometry
-            season_field_id = (
-                self.__master_data_management_service.extract_season_field_id(geometry)
-            )
-
-        sf_unique_id = self.__master_data_management_service.get_season_field_unique_id(
-            season_field_id
-        )
-
-        task_id = self.__analytics_processor_service.launch_brazil_in_season_crop_id_processor(
+        return self.__run_sf_analytics(
+            "brazil_crop_id",
+            geometry,
+            season_field_id,
             start_date=start_date,
             end_date=end_date,
-            seasonfield_id=sf_unique_id,
-            geometry=geometry,
-            season=season.value,
-        )
-
-        return self.check_status_and_metrics(
-            task_id, "CROP_IDENTIFICATION", sf_unique_id
+            season=season,
         )
 
     def get_potential_score_analytics(
@@ -1054,36 +1620,19 @@ class Geosys:
         Returns:
             A Pandas DataFrame containing several columns with metrics
         """
-        # validate and convert the geometry to WKT
-        geometry = Helper.convert_to_wkt(geometry)
-
-        if geometry is None:
-            raise ValueError("The geometry is not a valid WKT of GeoJson")
-
-        if not season_field_id:
-            # extract seasonfield id from geometry
-            season_field_id = (
-                self.__master_data_management_service.extract_season_field_id(geometry)
-            )
-
-        sf_unique_id = self.__master_data_management_service.get_season_field_unique_id(
-            season_field_id
-        )
-
-        task_id = self.__analytics_processor_service.launch_potential_score_processor(
+        return self.__run_sf_analytics(
+            "potential_score",
+            geometry,
+            season_field_id,
             end_date=end_date,
             nb_historical_years=nb_historical_years,
-            sowing_date=sowing_date,
             season_duration=season_duration,
             season_start_day=season_start_day,
             season_start_month=season_start_month,
-            seasonfield_id=sf_unique_id,
-            geometry=geometry,
-            crop=crop.value,
+            sowing_date=sowing_date,
+            crop=crop,
         )
 
-        return self.check_status_and_metrics(task_id, "POTENTIAL_SCORE", sf_unique_id)
-
     def get_greenness_analytics(
         self,
         start_date: str,
@@ -1106,33 +1655,16 @@ class Geosys:
         Returns:
             A Pandas DataFrame containing several columns with metrics
         """
-        # validate and convert the geometry to WKT
-        geometry = Helper.convert_to_wkt(geometry)
-
-        if geometry is None:
-            raise ValueError("The geometry is not a valid WKT of GeoJson")
-
-        if not season_field_id:
-            # extract seasonfield id from geometry
-            season_field_id = (
-                self.__master_data_management_service.extract_season_field_id(geometry)
-            )
-
-        sf_unique_id = self.__master_data_management_service.get_season_field_unique_id(
-            season_field_id
-        )
-
-        task_id = self.__analytics_processor_service.launch_greenness_processor(
+        return self.__run_sf_analytics(
+            "greenness",
+            geometry,
+            season_field_id,
             start_date=start_date,
             end_date=end_date,
             sowing_date=sowing_date,
-            seasonfield_id=sf_unique_id,
-            geometry=geometry,
-            crop=crop.value,
+            crop=crop,
         )
 
-        return self.check_status_and_metrics(task_id, "GREENNESS", sf_unique_id)
-
     def get_harvest_readiness_analytics(
         self,
         start_date: str,
@@ -1155,33 +1687,16 @@ class Geosys:
         Returns:
             A Pandas DataFrame containing several columns with metrics
         """
-        # validate and convert the geometry to WKT
-        geometry = Helper.convert_to_wkt(geometry)
-
-        if geometry is None:
-            raise ValueError("The geometry is not a valid WKT of GeoJson")
-
-        if not season_field_id:
-            # extract seasonfield id from geometry
-            season_field_id = (
-                self.__master_data_management_service.extract_season_field_id(geometry)
-            )
-
-        sf_unique_id = self.__master_data_management_service.get_season_field_unique_id(
-            season_field_id
-        )
-
-        task_id = self.__analytics_processor_service.launch_harvest_readiness_processor(
+        return self.__run_sf_analytics(
+            "harvest_readiness",
+            geometry,
+            season_field_id,
             start_date=start_date,
             end_date=end_date,
             sowing_date=sowing_date,
-            seasonfield_id=sf_unique_id,
-            geometry=geometry,
-            crop=crop.value,
+            crop=crop,
         )
 
-        return self.check_status_and_metrics(task_id, "HARVEST_READINESS", sf_unique_id)
-
     def get_planted_area_analytics(
         self,
         start_date: str,
@@ -1199,26 +1714,13 @@ class Geosys:
         Returns:
             A Pandas DataFrame containing several columns with metrics
         """
-        # validate and convert the geometry to WKT
-        geometry = Helper.convert_to_wkt(geometry)
-
-        if geometry is None:
-            raise ValueError("The geometry is not a valid WKT of GeoJson")
-
-        if not season_field_id:
-            # extract seasonfield id from geometry
-            season_field_id = (
-                self.__master_data_management_service.extract_season_field_id(geometry)
-            )
-
-        sf_unique_id = self.__master_data_management_service.get_season_field_unique_id(
-            season_field_id
-        )
-
-        task_id = self.__analytics_processor_service.launch_planted_area_processor(
-            start_date, end_date, sf_unique_id
+        return self.__run_sf_analytics(
+            "planted_area",
+            geometry,
+            season_field_id,
+            start_date=start_date,
+            end_date=end_date,
         )
-        return self.check_status_and_metrics(task_id, "PLANTED_AREA", sf_unique_id)
 
     def get_zarc_analytics(
         self,
@@ -1246,39 +1748,221 @@ class Geosys:
         Returns:
             A Pandas DataFrame containing several columns with metrics
         """
-        # validate and convert the geometry to WKT
-        geometry = Helper.convert_to_wkt(geometry)
+        return self.__run_sf_analytics(
+            "zarc",
+            geometry,
+            season_field_id,
+            start_date_emergence=start_date_emergence,
+            end_date_emergence=end_date_emergence,
+            nb_days_sowing_emergence=nb_days_sowing_emergence,
+            crop=crop,
+            soil_type=soil_type,
+            cycle=cycle,
+        )
 
-        if geometry is None:
-            raise ValueError("The geometry is not a valid WKT of GeoJson")
+    def run_analytics_batch(self, analytics_requests: List[AnalyticsRequest]):
+        """Runs several analytics at once: all the processors are launched before
+        waiting for any of them, and the season field of each geometry is only
+        resolved once.
+
+        This method can not be called from a running event loop (e.g. a notebook),
+        use `arun_analytics_batch` there.
+
+        Args:
+            analytics_requests (List[AnalyticsRequest]): the analytics to run
+
+        Returns:
+            A list of Pandas DataFrames containing the metrics, in the requests' order
+        """
+        return asyncio.run(self.arun_analytics_batch(analytics_requests))
+
+    async def arun_analytics_batch(self, analytics_requests: List[AnalyticsRequest]):
+        """Asynchronous version of `run_analytics_batch`.
 
-        # get municipio id from geometry
-        municipio_id = self.__gis_service.get_municipio_id_from_geometry(geometry)
+        Args:
+            analytics_requests (List[AnalyticsRequest]): the analytics to run
 
+        Returns:
+            A list of Pandas DataFrames containing the metrics, in the requests' order
+        """
+        for request in analytics_requests:
+            _get_season_field_analytics(request.kind)
+
+        # Resolves the season field of each geometry once before the launches,
+        # which then find it in the master data management service's cache.
+        # The analytics needing a municipio resolve it on launch, once their
+        # geometry is known to be in Brazil.
+        await asyncio.gather(
+            *(
+                asyncio.to_thread(self.__resolve_season_field, geometry, season_field_id)
+                for geometry, season_field_id in dict.fromkeys(
+                    (request.geometry, request.season_field_id)
+                    for request in analytics_requests
+                    if not _get_season_field_analytics(request.kind).with_municipio
+                )
+            )
+        )
+
+        tasks = await asyncio.gather(
+            *(self.alaunch_analytics(request) for request in analytics_requests)
+        )
+        return await asyncio.gather(
+            *(self.aget_analytics_result(task) for task in tasks)
+        )
+
+    def launch_analytics(self, analytics_request: AnalyticsRequest) -> AnalyticsTask:
+        """Launches an analytics processor without waiting for its end, so that
+        other work can be done before getting its result with `get_analytics_result`.
+
+        Args:
+            analytics_request (AnalyticsRequest): the analytics to launch
+
+        Returns:
+            An AnalyticsTask identifying the launched processor
+        """
+        analytics = _get_season_field_analytics(analytics_request.kind)
+        params = dict(analytics_request.params)
+        schema = analytics.schema
+        if callable(schema):
+            schema = schema(params)
+        for name in analytics.enum_params:
+            params[name] = params[name].value
+
+        if analytics.with_municipio:
+            wkt, sf_unique_id, params["municipio"] = (
+                self.__resolve_season_field_and_municipio(
+                    analytics_request.geometry, analytics_request.season_field_id
+                )
+            )
+        else:
+            wkt, sf_unique_id = self.__resolve_season_field(
+                analytics_request.geometry, analytics_request.season_field_id
+            )
+        if analytics.with_geometry:
+            params["geometry"] = wkt
+
+        launcher = getattr(self.__analytics_processor_service, analytics.launcher)
+        task_id = launcher(seasonfield_id=sf_unique_id, **params)
+        self.logger.debug("Task Id: %s", task_id)
+        return AnalyticsTask(task_id, schema, sf_unique_id)
+
+    async def alaunch_analytics(self, analytics_request: AnalyticsRequest) -> AnalyticsTask:
+        """Asynchronous version of `launch_analytics`."""
+        return await asyncio.to_thread(self.launch_analytics, analytics_request)
+
+    def get_analytics_result(self, analytics_task: AnalyticsTask):
+        """Waits for the end of a launched analytics processor and gets its metrics.
+
+        Args:
+            analytics_task (AnalyticsTask): the task returned by `launch_analytics`
+
+        Returns:
+            A Pandas DataFrame containing several columns with metrics
+        """
+        return self.check_status_and_metrics(
+            analytics_task.task_id, analytics_task.schema, analytics_task.sf_unique_id
+        )
+
+    async def aget_analytics_result(self, analytics_task: AnalyticsTask):
+        """Asynchronous version of `get_analytics_result`."""
+        return await self.acheck_status_and_metrics(
+            analytics_task.task_id, analytics_task.schema, analytics_task.sf_unique_id
+        )
+
+    async def arun_analytics(self, analytics_request: AnalyticsRequest):
+        """Runs an analytics without blocking the event loop while its task
+        runs, so that several analytics can be awaited together (e.g. with
+        asyncio.gather). This is the asynchronous version of the get_*_analytics
+        methods, e.g. `get_greenness_analytics(start_date, end_date, sowing_date,
+        crop, geometry)` is `arun_analytics(AnalyticsRequest("greenness",
+        {"start_date": ..., "end_date": ..., "sowing_date": ..., "crop": ...}, geometry))`.
+
+        Args:
+            analytics_request (AnalyticsRequest): the analytics to run
+
+        Returns:
+            A Pandas DataFrame containing several columns with metrics
+        """
+        analytics_task = await self.alaunch_analytics(analytics_request)
+        return await self.aget_analytics_result(analytics_task)
+
+    def __run_sf_analytics(
+        self, kind: str, geometry: str, season_field_id: Optional[str], **params
+    ):
+        """Launches an analytics on the season field of the geometry and waits
+        for its metrics."""
+        return self.get_analytics_result(
+            self.launch_analytics(
+                AnalyticsRequest(kind, params, geometry, season_field_id)
+            )
+        )
+
+    def __resolve_season_field_and_municipio(
+        self, geometry: str, season_field_id: Optional[str]
+    ):
+        """Resolves the season field of the geometry like `__resolve_season_field`,
+        and the Brazilian municipio it is in.
+
+        Returns:
+            A tuple (WKT geometry, season field unique id, municipio id)
+        """
+        wkt = self.__to_valid_wkt(geometry)
+
+        if not season_field_id:
+            # Resolving the season field of a geometry creates it: a geometry
+            # out of Brazil is rejected before that.
+            municipio_id = self.__get_municipio_id(wkt)
+            wkt, sf_unique_id = self.__resolve_season_field(wkt, season_field_id)
+            return wkt, sf_unique_id, municipio_id
+
+        # The unique id of an existing season field is only read: get the
+        # municipio id from the geometry meanwhile.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            municipio_future = executor.submit(self.__get_municipio_id, wkt)
+            wkt, sf_unique_id = self.__resolve_season_field(wkt, season_field_id)
+            municipio_id = municipio_future.result()
+        return wkt, sf_unique_id, municipio_id
+
+    def __get_municipio_id(self, wkt: str) -> int:
+        """Returns the id of the Brazilian municipio of a WKT geometry, raising
+        a ValueError if it is not in one."""
+        municipio_id = self.__gis_service.get_municipio_id_from_geometry(wkt)
         if municipio_id == 0:
             raise ValueError("No municipio id found for this geometry")
+        return municipio_id
+
+    @staticmethod
+    def __to_valid_wkt(geometry: str) -> str:
+        """Converts the geometry to WKT, raising a ValueError if it is not a
+        valid geometry, before any call to the APIs rather than on a server-side error."""
+        wkt = Helper.convert_to_wkt(geometry)
+
+        if wkt is None:
+            raise ValueError("The geometry is not a valid WKT of GeoJson")
+
+        if not Helper.is_valid_geometry(wkt):
+            raise ValueError("The geometry is empty or not valid")
+        return wkt
+
+    def __resolve_season_field(self, geometry: str, season_field_id: Optional[str]):
+        """Validates and converts the geometry to WKT, and resolves the unique id
+        of its season field (or of the given season field id).
+
+        Returns:
+            A tuple (WKT geometry, season field unique id)
+        """
+        wkt = self.__to_valid_wkt(geometry)
 
         if not season_field_id:
             # extract seasonfield id from geometry
             season_field_id = (
-                self.__master_data_management_service.extract_season_field_id(geometry)
+                self.__master_data_management_service.extract_season_field_id(wkt)
             )
 
         sf_unique_id = self.__master_data_management_service.get_season_field_unique_id(
             season_field_id
         )
-
-        task_id = self.__analytics_processor_service.launch_zarc_processor(
-            start_date_emergence=start_date_emergence,
-            end_date_emergence=end_date_emergence,
-            crop=crop.value,
-            cycle=cycle.value,
-            soil_type=soil_type.value,
-            municipio=municipio_id,
-            nb_days_sowing_emergence=nb_days_sowing_emergence,
-            seasonfield_id=sf_unique_id,
-        )
-        return self.check_status_and_metrics(task_id, "ZARC", sf_unique_id)
+        return wkt, sf_unique_id
 
     def get_farm_info_from_location(self, latitude: str, longitude: str):
         """get farm info from CAR layer
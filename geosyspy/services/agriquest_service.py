@@ -1,5 +1,4 @@
 """Agriquest Service class"""
-import json
 import logging
 from datetime import datetime
 from typing import List
@@ -11,6 +10,8 @@ from geosyspy.utils.http_client import HttpClient
 
 class AgriquestService:
 
+    __slots__ = ("base_url", "http_client", "logger")
+
     def __init__(self, base_url: str, http_client: HttpClient):
         self.base_url: str = base_url
         self.http_client: HttpClient = http_client
@@ -95,8 +96,7 @@ class AgriquestService:
         aq_url: str = urljoin(self.base_url, GeosysApiEndpoints.AGRIQUEST_ENDPOINT.value + parameters)
         response = self.http_client.post(aq_url, payload)
         if response.status_code == 200:
-            dict_response = response.json()
-            df = pd.read_json(json.dumps(dict_response))
+            df = pd.DataFrame(self.http_client.json(response))
 
             # Ignore first line
             df = df.iloc[1:]
@@ -145,8 +145,7 @@ class AgriquestService:
         aq_url: str = urljoin(self.base_url, GeosysApiEndpoints.AGRIQUEST_ENDPOINT.value + parameters)
         response = self.http_client.post(aq_url, payload)
         if response.status_code == 200:
-            dict_response = response.json()
-            df = pd.read_json(json.dumps(dict_response))
+            df = pd.DataFrame(self.http_client.json(response))
 
             # Ignore first line
             df = df.iloc[1:]
@@ -10,10 +10,20 @@ from geosyspy.utils.http_client import HttpClient
 
 class AnalyticsFabricService:
 
+    __slots__ = ("base_url", "http_client", "logger", "_metrics_url", "_latest_metrics_url")
+
     def __init__(self, base_url: str, http_client: HttpClient):
         self.base_url: str = base_url
         self.http_client: HttpClient = http_client
         self.logger = logging.getLogger(__name__)
+        # the metrics endpoints are joined to the base url once, the queries
+        # are appended to them on each call
+        self._metrics_url: str = urljoin(
+            self.base_url, GeosysApiEndpoints.ANALYTICS_FABRIC_ENDPOINT.value
+        )
+        self._latest_metrics_url: str = urljoin(
+            self.base_url, GeosysApiEndpoints.ANALYTICS_FABRIC_LATEST_ENDPOINT.value
+        )
 
 
     @staticmethod
@@ -110,14 +120,11 @@ class AnalyticsFabricService:
                           f'&Schema.Id={schema_id}' \
                           f'&%24limit=None'
 
-        af_url: str = urljoin(
-            self.base_url,
-            GeosysApiEndpoints.ANALYTICS_FABRIC_ENDPOINT.value + parameters,
-        )
+        af_url: str = self._metrics_url + parameters
         response = self.http_client.get(af_url)
 
         if response.status_code == 200:
-            df = pd.json_normalize(response.json())
+            df = pd.json_normalize(self.http_client.json(response))
             if df.empty:
                 if start_date is not None and end_date is not None:
                     date_msg =f"between:{start_date} and {end_date} "
@@ -130,18 +137,23 @@ class AnalyticsFabricService:
                              f"SeasonField:{season_field_id} "
                              f"{date_msg} ")
                 return df
-            df.drop("Entity.TypedId", inplace=True, axis=1)
-            df.rename(
-                columns={"Timestamp": "date"},
-                inplace=True,
-            )
-            df = df.sort_values(by="date")
-            df.set_index("date", inplace=True)
-            return df
+            return self.__index_metrics_by_date(df)
         else:
             self.logger.error("Issue in get_metrics. Status Code: "+str(response.status_code) +
                               " Error:" + str(response.json()))
 
+    @staticmethod
+    def __index_metrics_by_date(df: pd.DataFrame) -> pd.DataFrame:
+        """Returns the metrics without their entity, indexed and sorted by date."""
+        # the timestamps become the index directly: sorting the index avoids
+        # renaming, sorting and then moving a column
+        return (
+            df.drop(columns="Entity.TypedId")
+            .set_index("Timestamp")
+            .rename_axis("date")
+            .sort_index(kind="stable")
+        )
+
     def get_lastest_metrics(self, season_field_id: str,
                             schema_id: str):
         """Returns latest metrics from Analytics Fabrics in a pandas dataframe.
@@ -161,27 +173,17 @@ class AnalyticsFabricService:
                           f'&%24limit=1' \
                           f'&$sort=-Timestamp'
 
-        af_url: str = urljoin(
-            self.base_url,
-            GeosysApiEndpoints.ANALYTICS_FABRIC_LATEST_ENDPOINT.value + parameters,
-        )
+        af_url: str = self._latest_metrics_url + parameters
         response = self.http_client.get(af_url)
 
         if response.status_code == 200:
-            df = pd.json_normalize(response.json())
+            df = pd.json_normalize(self.http_client.json(response))
             if df.empty:
                 self.logger.info(f"No Latest metrics found in Analytic Fabric with "
                              f"SchemaId: {schema_id}, "
                              f"SeasonField:{season_field_id} ")
                 return df
-            df.drop("Entity.TypedId", inplace=True, axis=1)
-            df.rename(
-                columns={"Timestamp": "date"},
-                inplace=True,
-            )
-            df = df.sort_values(by="date")
-            df.set_index("date", inplace=True)
-            return df
+            return self.__index_metrics_by_date(df)
         else:
             self.logger.error("Issue in get_latests_metrics. Status Code: "+str(response.status_code)
                               + " Error:" + str(response.json()))
@@ -199,22 +201,17 @@ class AnalyticsFabricService:
         Returns:
             A response object.
         """
-        payload = []
-        for value in values:
-            prop = {
-                "Entity": {
-                    "TypedId": f"SeasonField:{season_field_id}"
-                },
-                "Schema": {"Id": schema_id, "Version": 1},
-            }
-            prop = dict(prop, **value)
-            payload.append(prop)
+        # the entity and schema are the same for all the values: they are
+        # built once and shared by the items, which are only serialized
+        prefix = {
+            "Entity": {
+                "TypedId": f"SeasonField:{season_field_id}"
+            },
+            "Schema": {"Id": schema_id, "Version": 1},
+        }
+        payload = [{**prefix, **value} for value in values]
 
-        af_url: str = urljoin(
-            self.base_url,
-            GeosysApiEndpoints.ANALYTICS_FABRIC_ENDPOINT.value,
-        )
-        response = self.http_client.patch(af_url, payload)
+        response = self.http_client.patch(self._metrics_url, payload)
         if response.status_code == 200:
             return response.status_code
         else:
@@ -1,23 +1,74 @@
 """Analytics Processor service class"""
+import asyncio
 import json
 import logging
 import datetime
+import threading
 from urllib.parse import urljoin
-import retrying
+import tenacity
 from geosyspy.utils.constants import GeosysApiEndpoints, Harvest, Emergence
 from geosyspy.services.service_constants import ProcessorConfiguration
 from geosyspy.utils.http_client import HttpClient
 
+class TransientTaskEventsError(ValueError):
+    """Raised when the events of a task could not be retrieved because they
+    are not published yet or because of a server error, which is worth retrying."""
+
+
+# A task is checked until it is not running anymore, shared by the blocking
+# and the asynchronous waits. The first checks are close to each other for
+# short processors, then the delay doubles up to 10 seconds.
+_TASK_STATUS_RETRY = {
+    "wait": tenacity.wait_exponential(multiplier=0.25, max=10),
+    "stop": tenacity.stop_after_attempt(50),
+    "retry": tenacity.retry_if_exception_type(KeyError),
+    "reraise": True,
+}
+
+# The events of an ended task may be published after its status: they are
+# fetched again with an exponential backoff, from 0.5 to 16 seconds.
+_TASK_EVENTS_RETRY = {
+    "wait": tenacity.wait_exponential(multiplier=0.5, max=16),
+    "stop": tenacity.stop_after_attempt(7),
+    "retry": tenacity.retry_if_exception_type((TransientTaskEventsError, KeyError)),
+    "reraise": True,
+}
+
+
+class _ProcessorLaunch:
+    """A processor launch in progress, whose task id (or error) is shared with
+    the identical launches waiting for it."""
+
+    __slots__ = ("done", "task_id", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.task_id = None
+        self.error = None
+
+    def result(self):
+        """Waits for the end of the launch and returns its task id."""
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.task_id
 
 
 class AnalyticsProcessorService:
 
+    __slots__ = ("base_url", "http_client", "logger", "_task_waits", "_launches", "_launches_lock")
+
     def __init__(self, base_url: str, http_client: HttpClient):
         self.base_url: str = base_url
         self.http_client: HttpClient = http_client
         self.logger = logging.getLogger(__name__)
+        # Pending asynchronous task status polls, by task id
+        self._task_waits: dict = {}
+        # Processor launches in progress, by endpoint and payload
+        self._launches: dict = {}
+        self._launches_lock = threading.Lock()
 
-    @retrying.retry(wait_exponential_multiplier=1000, wait_exponential_max=10000, stop_max_attempt_number=50, retry_on_exception=lambda exc: isinstance(exc, KeyError))
+    @tenacity.retry(**_TASK_STATUS_RETRY)
     def wait_and_check_task_status(self, task_id: str):
         """Check task status until it is ended for a specific analytics processor run
 
@@ -28,33 +79,97 @@ class AnalyticsProcessorService:
             task_status (str): the status of the task
 
         """
+        return self.__check_task_status(task_id)
+
+    async def await_task_status(self, task_id: str):
+        """Asynchronous version of `wait_and_check_task_status`: waits for the end
+        of the task without blocking the event loop between two checks.
+
+        A single poll runs per task: concurrent waits on the same task share
+        its result instead of each checking the status on their own.
+
+        Args:
+            task_id (str) : A string representing a task id
+
+        Returns:
+            task_status (str): the status of the task
+
+        """
+        task_wait = self._task_waits.get(task_id)
+        if task_wait is None:
+            task_wait = asyncio.ensure_future(self.__poll_task_status(task_id))
+            self._task_waits[task_id] = task_wait
+            task_wait.add_done_callback(lambda _: self._task_waits.pop(task_id, None))
+        # Shielded so that a cancelled waiter does not cancel the shared poll.
+        return await asyncio.shield(task_wait)
+
+    async def __poll_task_status(self, task_id: str):
+        async for attempt in tenacity.AsyncRetrying(**_TASK_STATUS_RETRY):
+            with attempt:
+                return await asyncio.to_thread(self.__check_task_status, task_id)
+
+    def __check_task_status(self, task_id: str):
+        """Checks the task status once, raising a KeyError while it is running."""
 
         events_endpoint: str = urljoin(self.base_url,
                                        GeosysApiEndpoints.PROCESSOR_EVENTS_ENDPOINT.value + "/" + task_id)
 
-        while True:
-            response = self.http_client.get(events_endpoint)
-            if response.ok:
-                dict_resp = json.loads(response.content)
-                task_status = dict_resp["status"]
-            else:
-                self.logger.info(response.status_code)
-                return "Failed"
+        response = self.http_client.get(events_endpoint)
+        if response.ok:
+            dict_resp = json.loads(response.content)
+            task_status = dict_resp["status"]
+        else:
+            self.logger.info(response.status_code)
+            return "Failed"
 
-            if task_status == "Ended":
-                break  # the task is completed.
-            elif task_status == "Running":
-                self.logger.info("Retry -- Task still running")
-                raise KeyError("Task still running")  # raise exception to retry
-            else:
-                raise Exception(f"Task Status: {task_status}, Content: {response.content}" )
+        if task_status == "Running":
+            self.logger.info("Retry -- Task still running")
+            raise KeyError("Task still running")  # raise exception to retry
+        if task_status != "Ended":
+            raise Exception(f"Task Status: {task_status}, Content: {response.content}" )
 
         return task_status
 
+    def __launch_processor(self, processor_endpoint: str, payload: dict):
+        """Launches a processor and returns its task id.
+
+        Identical launches running at the same time (e.g. from a batch or from
+        several threads) share a single request, and so a single task.
+        """
+        key = (processor_endpoint, json.dumps(payload, sort_keys=True))
+        with self._launches_lock:
+            launch = self._launches.get(key)
+            is_owner = launch is None
+            if is_owner:
+                launch = self._launches[key] = _ProcessorLaunch()
+        if not is_owner:
+            return launch.result()
+
+        try:
+            response = self.http_client.post(processor_endpoint, payload)
+            if not response.ok:
+                self.logger.info(response.status_code)
+                raise ValueError(response.content)
+            launch.task_id = json.loads(response.content)["taskId"]
+        except BaseException as exc:
+            launch.error = exc
+            raise
+        finally:
+            # The launch is forgotten before its waiters are released: a new
+            # identical launch then sends its own request.
+            with self._launches_lock:
+                self._launches.pop(key, None)
+            launch.done.set()
+        return launch.task_id
+
+    @tenacity.retry(**_TASK_EVENTS_RETRY)
     def get_s3_path_from_task_and_processor(self, task_id: str,
                                             processor_name: str):
         """Returns S3 path related to task_id
 
+        The task events are fetched again with an exponential backoff while
+        they are not published yet (404) or the server fails (5xx).
+
         Args:
             task_id : A string representing a task id
             processor_name: the processor name
@@ -75,6 +190,8 @@ class AnalyticsProcessorService:
             return f"s3://geosys-{customer_code}/{user_id}/{processor_name}/{task_id}"
         
         self.logger.info(response.status_code)
+        if response.status_code == 404 or response.status_code >= 500:
+            raise TransientTaskEventsError(response.content)
         raise ValueError(response.content)
 
     def launch_mr_time_series_processor(self, polygon,
@@ -132,13 +249,7 @@ class AnalyticsProcessorService:
                                           GeosysApiEndpoints.LAUNCH_PROCESSOR_ENDPOINT.value.format(
                                               ProcessorConfiguration.MRTS.value['api_processor_path']))
 
-        response = self.http_client.post(processor_endpoint, payload)
-
-        if response.ok:
-            task_id = json.loads(response.content)["taskId"]
-            return task_id
-        self.logger.info(response.status_code)
-        raise ValueError(response.content)
+        return self.__launch_processor(processor_endpoint, payload)
 
     def launch_planted_area_processor(self,
                                       start_date: str,
@@ -170,13 +281,7 @@ class AnalyticsProcessorService:
         processor_endpoint: str = urljoin(self.base_url,
                                           GeosysApiEndpoints.LAUNCH_PROCESSOR_ENDPOINT.value.format(ProcessorConfiguration.PLANTED_AREA.value['api_processor_path']))
 
-        response = self.http_client.post(processor_endpoint, payload)
-
-        if response.ok:
-            task_id = json.loads(response.content)["taskId"]
-            return task_id
-        self.logger.info(response.status_code)
-        raise ValueError(response.content)
+        return self.__launch_processor(processor_endpoint, payload)
 
     def launch_harvest_processor(self,
                                  season_duration: int,
@@ -225,13 +330,7 @@ class AnalyticsProcessorService:
         processor_endpoint: str = urljoin(self.base_url,
                                           GeosysApiEndpoints.LAUNCH_PROCESSOR_ENDPOINT.value.format(ProcessorConfiguration[harvest_type.name].value['api_processor_path']))
 
-        response = self.http_client.post(processor_endpoint, payload)
-
-        if response.ok:
-            task_id = json.loads(response.content)["taskId"]
-            return task_id        
-        self.logger.info(response.status_code)
-        raise ValueError(response.content)
+        return self.__launch_processor(processor_endpoint, payload)
 
     def launch_emergence_processor(self,
                                    season_duration: int,
@@ -283,13 +382,7 @@ class AnalyticsProcessorService:
         processor_endpoint: str = urljoin(self.base_url,
                                           GeosysApiEndpoints.LAUNCH_PROCESSOR_ENDPOINT.value.format( ProcessorConfiguration[emergence_type.name].value['api_processor_path']))
 
-        response = self.http_client.post(processor_endpoint, payload)
-
-        if response.ok:
-            task_id = json.loads(response.content)["taskId"]
-            return task_id
-        self.logger.info(response.status_code)
-        raise ValueError(response.content)
+        return self.__launch_processor(processor_endpoint, payload)
 
     def launch_potential_score_processor(self,
                                          season_duration: int,
@@ -342,13 +435,7 @@ class AnalyticsProcessorService:
         processor_endpoint: str = urljoin(self.base_url,
                                           GeosysApiEndpoints.LAUNCH_PROCESSOR_ENDPOINT.value.format(ProcessorConfiguration.POTENTIAL_SCORE.value['api_processor_path']))
 
-        response = self.http_client.post(processor_endpoint, payload)
-
-        if response.ok:
-            task_id = json.loads(response.content)["taskId"]
-            return task_id
-        self.logger.info(response.status_code)
-        raise ValueError(response.content)
+        return self.__launch_processor(processor_endpoint, payload)
 
     def launch_brazil_in_season_crop_id_processor(self,
                                                   start_date: str,
@@ -390,13 +477,7 @@ class AnalyticsProcessorService:
         processor_endpoint: str = urljoin(self.base_url,
                                           GeosysApiEndpoints.LAUNCH_PROCESSOR_ENDPOINT.value.format(ProcessorConfiguration.BRAZIL_IN_SEASON_CROP_ID.value['api_processor_path']))
 
-        response = self.http_client.post(processor_endpoint, payload)
-
-        if response.ok:
-            task_id = json.loads(response.content)["taskId"]
-            return task_id
-        self.logger.info(response.status_code)
-        raise ValueError(response.content)
+        return self.__launch_processor(processor_endpoint, payload)
 
     def launch_greenness_processor(self,
                                    start_date: str,
@@ -440,13 +521,7 @@ class AnalyticsProcessorService:
         processor_endpoint: str = urljoin(self.base_url,
                                           GeosysApiEndpoints.LAUNCH_PROCESSOR_ENDPOINT.value.format(ProcessorConfiguration.GREENNESS.value['api_processor_path']))
 
-        response = self.http_client.post(processor_endpoint, payload)
-
-        if response.ok:
-            task_id = json.loads(response.content)["taskId"]
-            return task_id
-        self.logger.info(response.status_code)
-        raise ValueError(response.content)
+        return self.__launch_processor(processor_endpoint, payload)
 
 
     def launch_harvest_readiness_processor(self,
@@ -491,13 +566,7 @@ class AnalyticsProcessorService:
         processor_endpoint: str = urljoin(self.base_url,
                                           GeosysApiEndpoints.LAUNCH_PROCESSOR_ENDPOINT.value.format(ProcessorConfiguration.HARVEST_READINESS.value['api_processor_path']))
 
-        response = self.http_client.post(processor_endpoint, payload)
-
-        if response.ok:
-            task_id = json.loads(response.content)["taskId"]
-            return task_id
-        self.logger.info(response.status_code)
-        raise ValueError(response.content)
+        return self.__launch_processor(processor_endpoint, payload)
 
     def launch_zarc_processor(self,
                               start_date_emergence: str,
@@ -546,10 +615,4 @@ class AnalyticsProcessorService:
                                             GeosysApiEndpoints.LAUNCH_PROCESSOR_ENDPOINT.value.format(
                                                 ProcessorConfiguration.ZARC.value['api_processor_path']))
 
-        response = self.http_client.post(processor_endpoint, payload)
-
-        if response.ok:
-            task_id = json.loads(response.content)["taskId"]
-            return task_id
-        self.logger.info(response.status_code)
-        raise ValueError(response.content)
+        return self.__launch_processor(processor_endpoint, payload)
@@ -7,6 +7,8 @@ from geosyspy.utils.http_client import HttpClient
 
 class GisService:
 
+    __slots__ = ("base_url", "http_client", "logger")
+
     def __init__(self, base_url: str, http_client: HttpClient):
         self.base_url: str = base_url
         self.http_client: HttpClient = http_client
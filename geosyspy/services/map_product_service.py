@@ -6,7 +6,8 @@ from typing import Optional
 from urllib.parse import urljoin
 
 import pandas as pd
-from requests import HTTPError
+from requests import ConnectionError as RequestsConnectionError
+from requests import HTTPError, Timeout
 
 from geosyspy.utils.constants import (
     PRIORITY_HEADERS,
@@ -16,13 +17,22 @@ from geosyspy.utils.constants import (
 from geosyspy.utils.http_client import HttpClient
 
 
+class TransientCoverageError(Exception):
+    """Raised when the satellite coverage could not be retrieved because of a
+    server error or a timeout, which is worth retrying."""
+
+
 class MapProductService:
 
+    __slots__ = ("base_url", "http_client", "priority_queue", "logger", "_zipped_tiff_urls")
+
     def __init__(self, base_url: str, http_client: HttpClient, priority_queue: str):
         self.base_url: str = base_url
         self.http_client: HttpClient = http_client
         self.priority_queue: str = priority_queue
         self.logger = logging.getLogger(__name__)
+        # download url of the zipped tiffs, by upper-cased indicator
+        self._zipped_tiff_urls: dict = {}
 
     def get_satellite_coverage(
         self,
@@ -53,6 +63,9 @@ class MapProductService:
         Returns:
             DataFrame
 
+        Raises:
+            TransientCoverageError: the API answered with a server error or timed out.
+
         """
 
         self.logger.info("Calling APIs for coverage")
@@ -85,14 +98,21 @@ class MapProductService:
         else:
             payload = {"seasonFields": [{"id": season_field_id}]}
 
-        response = self.http_client.post(
-            flm_url,
-            payload,
-            {"X-Geosys-Task-Code": PRIORITY_HEADERS[self.priority_queue]},
-        )
+        try:
+            response = self.http_client.post(
+                flm_url,
+                payload,
+                {"X-Geosys-Task-Code": PRIORITY_HEADERS[self.priority_queue]},
+            )
+        except (RequestsConnectionError, Timeout) as exc:
+            raise TransientCoverageError(str(exc)) from exc
 
+        if response.status_code >= 500:
+            raise TransientCoverageError(
+                f"Unable to retrieve the satellite coverage. Server error: {response.status_code}"
+            )
         if response.status_code == 200:
-            df = pd.json_normalize(response.json())
+            df = pd.json_normalize(self.http_client.json(response))
             if df.empty:
                 return df
             else:
@@ -112,20 +132,15 @@ class MapProductService:
             self.logger.info(response.status_code)
 
     def get_zipped_tiff(
-        self, field_id: str, field_geometry: str, image_id: str, indicator: str
+        self,
+        field_id: str,
+        field_geometry: str,
+        image_id: str,
+        indicator: str,
+        stream: bool = False,
     ):
 
-        if indicator != "" and indicator.upper() != "REFLECTANCE":
-            parameters = f"/{indicator.upper()}/image.tiff.zip?resolution=Sensor"
-            download_tiff_url: str = urljoin(
-                self.base_url,
-                GeosysApiEndpoints.FLM_BASE_REFERENCE_MAP_POST.value + parameters,
-            )
-        else:
-            parameters = f"/TOC/image.tiff.zip?resolution=Sensor"
-            download_tiff_url: str = urljoin(
-                self.base_url, GeosysApiEndpoints.FLM_REFLECTANCE_MAP.value + parameters
-            )
+        download_tiff_url: str = self.__get_zipped_tiff_url(indicator)
 
         if not field_id or field_id == "":
             payload = {
@@ -138,15 +153,42 @@ class MapProductService:
         response_zipped_tiff = self.http_client.post(
             download_tiff_url,
             payload,
-            {"X-Geosys-Task-Code": PRIORITY_HEADERS[self.priority_queue]},
+            # the archive is already compressed: it is not encoded again
+            {
+                "X-Geosys-Task-Code": PRIORITY_HEADERS[self.priority_queue],
+                "Accept-Encoding": "identity",
+            },
+            stream=stream,
         )
         if response_zipped_tiff.status_code != 200:
+            # releases the pooled connection of an unread streamed response
+            response_zipped_tiff.close()
             raise HTTPError(
                 "Unable to download tiff.zip file. Server error: "
                 + str(response_zipped_tiff.status_code)
             )
         return response_zipped_tiff
 
+    def __get_zipped_tiff_url(self, indicator: str) -> str:
+        """Returns the download url of the zipped tiffs of an indicator, built
+        once per indicator."""
+        indicator = indicator.upper()
+        download_tiff_url = self._zipped_tiff_urls.get(indicator)
+        if download_tiff_url is None:
+            if indicator not in ("", "REFLECTANCE"):
+                parameters = f"/{indicator}/image.tiff.zip?resolution=Sensor"
+                download_tiff_url = urljoin(
+                    self.base_url,
+                    GeosysApiEndpoints.FLM_BASE_REFERENCE_MAP_POST.value + parameters,
+                )
+            else:
+                parameters = "/TOC/image.tiff.zip?resolution=Sensor"
+                download_tiff_url = urljoin(
+                    self.base_url, GeosysApiEndpoints.FLM_REFLECTANCE_MAP.value + parameters
+                )
+            self._zipped_tiff_urls[indicator] = download_tiff_url
+        return download_tiff_url
+
     def get_product(
         self, field_id: str, image_id: str, indicator: str, image: str = None
     ):
@@ -188,7 +230,7 @@ class MapProductService:
                 file.write(response_product.content)
             return "Image stocked locally"
         else:
-            df = pd.json_normalize(response_product.json())
+            df = pd.json_normalize(self.http_client.json(response_product))
             return df
 
     def get_zipped_tiff_difference_map(
@@ -232,7 +274,11 @@ class MapProductService:
         response_zipped_tiff = self.http_client.post(
             download_tiff_url,
             payload,
-            {"X-Geosys-Task-Code": PRIORITY_HEADERS[self.priority_queue]},
+            # the archive is already compressed: it is not encoded again
+            {
+                "X-Geosys-Task-Code": PRIORITY_HEADERS[self.priority_queue],
+                "Accept-Encoding": "identity",
+            },
         )
         if response_zipped_tiff.status_code != 200:
             raise HTTPError(
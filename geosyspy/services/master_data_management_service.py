@@ -5,17 +5,44 @@ from datetime import datetime
 from typing import List, Optional
 from urllib.parse import urljoin
 
-from geosyspy.utils.constants import SEASON_FIELD_ID_REGEX, GeosysApiEndpoints
+from geosyspy.utils.constants import (
+    SEASON_FIELD_CACHE_MAXSIZE,
+    SEASON_FIELD_ID_REGEX,
+    GeosysApiEndpoints,
+)
 from geosyspy.utils.helper import Helper
 from geosyspy.utils.http_client import HttpClient
+from geosyspy.utils.lru_cache import LRUCache
 
 
 class MasterDataManagementService:
 
+    __slots__ = (
+        "base_url",
+        "http_client",
+        "logger",
+        "_season_field_ids",
+        "_season_field_unique_ids",
+        "_existing_season_field_ids",
+    )
+
     def __init__(self, base_url: str, http_client: HttpClient):
         self.base_url: str = base_url
         self.http_client: HttpClient = http_client
         self.logger = logging.getLogger(__name__)
+        # Season field lookups are cached per instance: a season field id
+        # does not change once it has been created for a polygon. Polygons
+        # are keyed by their WKB, so that differently formatted WKTs match.
+        # The caches are bounded: the least recently used lookups are evicted.
+        self._season_field_ids = LRUCache(SEASON_FIELD_CACHE_MAXSIZE)
+        self._season_field_unique_ids = LRUCache(SEASON_FIELD_CACHE_MAXSIZE)
+        self._existing_season_field_ids = LRUCache(SEASON_FIELD_CACHE_MAXSIZE)
+
+    def clear_cache(self):
+        """Clears the cached season field lookups."""
+        self._season_field_ids.clear()
+        self._season_field_unique_ids.clear()
+        self._existing_season_field_ids.clear()
 
     def create_season_field_id(self, polygon: str) -> object:
         """Posts the payload below to the master data management endpoint.
@@ -56,6 +83,11 @@ class MasterDataManagementService:
             ValueError: The response status code is not as expected.
         """
 
+        polygon_key = Helper.get_geometry_key(polygon)
+        season_field_id = self._season_field_ids.get(polygon_key)
+        if season_field_id is not None:
+            return season_field_id
+
         response = self.create_season_field_id(polygon)
         dict_response = response.json()
 
@@ -65,9 +97,14 @@ class MasterDataManagementService:
         ):
 
             text: str = dict_response["errors"]["body"]["sowingDate"][0]["message"]
-            return Helper.get_matched_str_from_pattern(SEASON_FIELD_ID_REGEX, text)
+            season_field_id = Helper.get_matched_str_from_pattern(
+                SEASON_FIELD_ID_REGEX, text
+            )
+            self._season_field_ids.set(polygon_key, season_field_id)
+            return season_field_id
 
         if response.status_code == 201:
+            self._season_field_ids.set(polygon_key, dict_response["id"])
             return dict_response["id"]
         raise ValueError(
             f"Cannot handle HTTP response : {str(response.status_code)} : {str(response.json())}"
@@ -94,6 +131,10 @@ class MasterDataManagementService:
             ValueError: The response status code is not as expected.
         """
 
+        unique_id = self._season_field_unique_ids.get(season_field_id)
+        if unique_id is not None:
+            return unique_id
+
         mdm_url: str = urljoin(
             self.base_url,
             GeosysApiEndpoints.MASTER_DATA_MANAGEMENT_ENDPOINT.value
@@ -106,7 +147,9 @@ class MasterDataManagementService:
 
         # extract unique id from response:
         if response.status_code == 200:
-            return dict_response["externalIds"]["id"]
+            unique_id = dict_response["externalIds"]["id"]
+            self._season_field_unique_ids.set(season_field_id, unique_id)
+            return unique_id
         raise ValueError(
             f"Cannot handle HTTP response : {str(response.status_code)} : {str(response.json())}"
         )
@@ -124,6 +167,11 @@ class MasterDataManagementService:
             ValueError: The response status code is not as expected.
         """
 
+        # Only existing season fields are cached: a missing one may be
+        # created or shared with the user later on.
+        if season_field_id in self._existing_season_field_ids:
+            return True
+
         mdm_url: str = urljoin(
             self.base_url,
             GeosysApiEndpoints.MASTER_DATA_MANAGEMENT_ENDPOINT.value
@@ -136,6 +184,7 @@ class MasterDataManagementService:
 
         # extract unique id from response:
         if response.status_code == 200:
+            self._existing_season_field_ids.set(season_field_id, True)
             return True
         return False
 
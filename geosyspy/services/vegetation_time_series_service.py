@@ -1,19 +1,28 @@
 """ Vegetation Time Series service class"""
-import json
 import logging
 from datetime import datetime
-from urllib.parse import urljoin
+from urllib.parse import quote, urlencode, urljoin
 import pandas as pd
-from geosyspy.utils.constants import GeosysApiEndpoints
+from geosyspy.utils.constants import PIXEL_ID_REGEX, GeosysApiEndpoints
 from geosyspy.utils.http_client import HttpClient
 
 
 class VegetationTimeSeriesService:
 
+    __slots__ = ("base_url", "http_client", "logger", "_values_url", "_pixel_values_url")
+
     def __init__(self, base_url: str, http_client: HttpClient):
         self.base_url: str = base_url
         self.http_client: HttpClient = http_client
         self.logger = logging.getLogger(__name__)
+        # the values endpoints are joined to the base url once, the queries
+        # are appended to them on each call
+        self._values_url: str = urljoin(
+            self.base_url, GeosysApiEndpoints.VTS_ENDPOINT.value + "/values"
+        )
+        self._pixel_values_url: str = urljoin(
+            self.base_url, GeosysApiEndpoints.VTS_BY_PIXEL_ENDPOINT.value + "/values"
+        )
 
     def get_modis_time_series(self, season_field_id:str,
                               start_date:datetime,
@@ -48,13 +57,16 @@ class VegetationTimeSeriesService:
         self.logger.info("Calling APIs for aggregated time series")
         start_date: str = start_date.strftime("%Y-%m-%d")
         end_date: str = end_date.strftime("%Y-%m-%d")
-        parameters: str = f"/values?$offset=0&$limit=None&$count=false&SeasonField.Id={season_field_id}&index={indicator}&$filter=Date >= '{start_date}' and Date <= '{end_date}'"
-        vts_url: str = urljoin(self.base_url, GeosysApiEndpoints.VTS_ENDPOINT.value + parameters)
+        vts_url: str = self._values_url + "?" + self.__get_values_query(
+            season_field_id, start_date, end_date, indicator
+        )
         response = self.http_client.get(vts_url)
 
         if response.status_code == 200:
-            dict_response = response.json()
-            df = pd.read_json(json.dumps(dict_response))
+            # the aggregated values are flat records: no need to normalize them
+            df = pd.DataFrame.from_records(self.http_client.json(response))
+            # the dates are ISO 8601: no need to infer their format per response
+            df["date"] = pd.to_datetime(df["date"], format="ISO8601")
             df.set_index("date", inplace=True)
             return df
         self.logger.info(response.status_code)
@@ -96,17 +108,31 @@ class VegetationTimeSeriesService:
         self.logger.info("Calling APIs for time series by the pixel")
         start_date: str = start_date.strftime("%Y-%m-%d")
         end_date: str = end_date.strftime("%Y-%m-%d")
-        parameters: str = f"/values?$offset=0&$limit=None&$count=false&SeasonField.Id={season_field_id}&index={indicator}&$filter=Date >= '{start_date}' and Date <= '{end_date}'"
-        vts_url: str = urljoin(
-            self.base_url,
-            GeosysApiEndpoints.VTS_BY_PIXEL_ENDPOINT.value + parameters
-            )
+        vts_url: str = self._pixel_values_url + "?" + self.__get_values_query(
+            season_field_id, start_date, end_date, indicator
+        )
         response = self.http_client.get(vts_url)
 
         if response.status_code == 200:
             return self.extract_pixel(response)
         self.logger.info(response.status_code)
 
+    @staticmethod
+    def __get_values_query(season_field_id: str, start_date: str, end_date: str, indicator: str) -> str:
+        """Returns the url-encoded query string of the values of an indicator
+        of a season field between two dates."""
+        return urlencode(
+            {
+                "$offset": 0,
+                "$limit": "None",
+                "$count": "false",
+                "SeasonField.Id": season_field_id,
+                "index": indicator,
+                "$filter": f"Date >= '{start_date}' and Date <= '{end_date}'",
+            },
+            quote_via=quote,
+        )
+
     def extract_pixel(self, response):
         """
         Extracts h, v, i, and j coordinates from the pixel dataframe.
@@ -117,29 +143,27 @@ class VegetationTimeSeriesService:
         Returns:
             DataFrame: A DataFrame with index, value, pixel.id, X, and Y columns.
         """
-        df = pd.json_normalize(response.json())
+        df = pd.json_normalize(self.http_client.json(response))
         df.set_index("date", inplace=True)
 
-        # Extracts h, v, i and j from the pixel dataframe
+        # Extracts h, v, i and j from the pixel dataframe, in a single pass
         self.logger.info("Computing X and Y coordinates per pixel... ")
-        df["h"] = df["pixel.id"].str.extract(r"h(.*)v").astype(int)
-        df["v"] = df["pixel.id"].str.extract(r"v(.*)i").astype(int)
-        df["i"] = df["pixel.id"].str.extract(r"i(.*)j").astype(int)
-        df["j"] = df["pixel.id"].str.extract(r"j(.*)$").astype(int)
+        hvij = df["pixel.id"].str.extract(PIXEL_ID_REGEX).astype(int).to_numpy()
+        h, v, i, j = hvij.T
 
         # PSX/PSY : size in meters of one pixel
         # MODIS_GRID_LENGTH : theoretical length of the modis grid in meters
         # MODIS_GRID_HEIGHT : theoretical height of the modis grid in meters
         PSX = 231.65635826
         MODIS_GRID_LENGTH = 4800 * PSX * 36
-        # XUL/YUL : The coordinates of the top left corner of the tile h,v's top left pixel
-        #  X/Y : the coordinates of the top left corner of the i,j pixel
-        df["XUL"] = (df["h"] + 1) * 4800 * PSX - MODIS_GRID_LENGTH / 2
         PSY = -231.65635826
         MODIS_GRID_HEIGHT = 4800 * PSY * 18
 
-        df["YUL"] = (df["v"] + 1) * 4800 * PSY + MODIS_GRID_HEIGHT / 2
-        df["X"] = df["i"] * PSX + df["XUL"]
-        df["Y"] = df["j"] * PSY + df["YUL"]
+        # XUL/YUL : The coordinates of the top left corner of the tile h,v's top left pixel
+        #  X/Y : the coordinates of the top left corner of the i,j pixel
+        xul = (h + 1) * 4800 * PSX - MODIS_GRID_LENGTH / 2
+        yul = (v + 1) * 4800 * PSY + MODIS_GRID_HEIGHT / 2
+        df["X"] = i * PSX + xul
+        df["Y"] = j * PSY + yul
         self.logger.info("Done ! ")
         return df[["index", "value", "pixel.id", "X", "Y"]]
@@ -1,23 +1,39 @@
 """Wether Service class"""
 
 import logging
+import time
 from typing import List
 from datetime import datetime
-from urllib.parse import urljoin
+from urllib.parse import quote, urlencode, urljoin
 import pandas as pd
-from shapely import wkt
 
-from geosyspy.utils.constants import WeatherTypeCollection, GeosysApiEndpoints
+from geosyspy.utils.constants import (
+    WEATHER_CACHE_MAXSIZE,
+    WEATHER_CACHE_TTL,
+    WeatherTypeCollection,
+    GeosysApiEndpoints,
+)
+from geosyspy.utils.helper import Helper
 from geosyspy.utils.http_client import HttpClient
+from geosyspy.utils.lru_cache import LRUCache
 
 
 class WeatherService:
     """Service to retrieve weather data from geosys Weather API"""
 
+    __slots__ = ("base_url", "http_client", "logger", "_weather_url", "_weather_cache")
+
     def __init__(self, base_url: str, http_client: HttpClient):
         self.base_url: str = base_url
         self.http_client: HttpClient = http_client
         self.logger = logging.getLogger(__name__)
+        self._weather_url: str = urljoin(
+            self.base_url, GeosysApiEndpoints.WEATHER_ENDPOINT.value
+        )
+        # Historical daily weather does not change once published: it is cached
+        # per centroid, date range and fields for WEATHER_CACHE_TTL seconds.
+        # Forecasts are updated over time and are always requested again.
+        self._weather_cache = LRUCache(WEATHER_CACHE_MAXSIZE)
 
     def get_weather(
         self,
@@ -51,24 +67,47 @@ class WeatherService:
 
         start_date: str = start_date.strftime("%Y-%m-%d")
         end_date: str = end_date.strftime("%Y-%m-%d")
-        polygon_wkt = wkt.loads(polygon)
+        centroid_wkt: str = Helper.get_centroid_wkt(polygon)
         weather_fields: str = ",".join(fields)
-        parameters: str = (
-            f"?%24offset=0&%24limit=None&%24count=false&Location={polygon_wkt.centroid.wkt}&Date=%24between%3A{start_date}T00%3A00%3A00.0000000Z%7C{end_date}T00%3A00%3A00.0000000Z&Provider=GLOBAL1&WeatherType={weather_type}&$fields={weather_fields}"
-        )
-        weather_url: str = urljoin(
-            self.base_url, GeosysApiEndpoints.WEATHER_ENDPOINT.value + parameters
+
+        cache_key = None
+        if weather_type == WeatherTypeCollection.WEATHER_HISTORICAL_DAILY.value:
+            cache_key = (centroid_wkt, start_date, end_date, weather_type, weather_fields)
+            cached = self._weather_cache.get(cache_key)
+            if cached is not None:
+                expires_at, df = cached
+                if time.monotonic() < expires_at:
+                    return df.copy()
+                self._weather_cache.pop(cache_key, None)
+
+        weather_url: str = self._weather_url + "?" + urlencode(
+            {
+                "$offset": 0,
+                "$limit": "None",
+                "$count": "false",
+                "Location": centroid_wkt,
+                "Date": f"$between:{start_date}T00:00:00.0000000Z|{end_date}T00:00:00.0000000Z",
+                "Provider": "GLOBAL1",
+                "WeatherType": weather_type,
+                "$fields": weather_fields,
+            },
+            quote_via=quote,
         )
 
         response = self.http_client.get(weather_url)
 
         if response.status_code == 200:
-            df = pd.json_normalize(response.json())
+            df = pd.json_normalize(self.http_client.json(response))
             if df.empty:
                 return df
 
             df.set_index("date", inplace=True)
-            df["Location"] = polygon_wkt.centroid.wkt
-            return df.sort_index()
+            df["Location"] = centroid_wkt
+            df = df.sort_index()
+            if cache_key is not None:
+                self._weather_cache.set(
+                    cache_key, (time.monotonic() + WEATHER_CACHE_TTL, df.copy())
+                )
+            return df
         self.logger.error(response.status_code)
         raise ValueError(response.content)
@@ -4,5 +4,6 @@ __all__ = [
     "oauth2_client",
     "http_client",
     "helper",
+    "lru_cache",
     "jwt_validator"
     ]
@@ -1,3 +1,4 @@
+import re
 from enum import Enum
 
 
@@ -176,14 +177,48 @@ class GeosysApiEndpoints(Enum):
     LAUNCH_PROCESSOR_ENDPOINT = "analytics-pipeline/v1/processors/{}/launch"
 
 
-LR_SATELLITE_COLLECTION = [SatelliteImageryCollection.MODIS]
-MR_SATELLITE_COLLECTION = [
+LR_SATELLITE_COLLECTION = frozenset({SatelliteImageryCollection.MODIS})
+MR_SATELLITE_COLLECTION = frozenset({
     SatelliteImageryCollection.LANDSAT_8,SatelliteImageryCollection.LANDSAT_9,
     SatelliteImageryCollection.SENTINEL_2, SatelliteImageryCollection.ALSAT_1B,
     SatelliteImageryCollection.CBERS_4, SatelliteImageryCollection.DEIMOS_1,
     SatelliteImageryCollection.GAOFEN, SatelliteImageryCollection.KAZSTSAT,
     SatelliteImageryCollection.RESOURCESAT2
-    ]
+    })
+
+MR_TIME_SERIES_DEFAULT_SENSORS = (
+    "micasense",
+    "sequoia",
+    "m4c",
+    "sentinel_2",
+    "landsat_8",
+    "landsat_9",
+    "cbers4",
+    "kazstsat",
+    "alsat_1b",
+    "huanjing_2",
+    "deimos",
+    "gaofen_1",
+    "gaofen_6",
+    "resourcesat2",
+    "dmc_2",
+    "landsat_5",
+    "landsat_7",
+    "spot",
+    "rapideye_3a",
+    "rapideye_1b",
+)
 
 PRIORITY_HEADERS = {"bulk": "Geosys_API_Bulk", "realtime": ""}
-SEASON_FIELD_ID_REGEX = r"\sId:\s(\w+),"
+DOWNLOAD_MAX_WORKERS = 8
+HTTP_POOL_MAXSIZE = 32
+TOKEN_REFRESH_MARGIN = 5 * 60
+METRICS_CACHE_TTL = 60
+METRICS_CACHE_MAXSIZE = 256
+SEASON_FIELD_CACHE_MAXSIZE = 1024
+WEATHER_CACHE_TTL = 24 * 60 * 60
+WEATHER_CACHE_MAXSIZE = 2048
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+DOWNLOAD_SPOOL_MAX_SIZE = 64 * 1024 * 1024
+SEASON_FIELD_ID_REGEX = re.compile(r"\sId:\s(\w+),")
+PIXEL_ID_REGEX = re.compile(r"h(\d+)v(\d+)i(\d+)j(\d+)")
@@ -1,8 +1,9 @@
 """ Helper class"""
 import re
-import json
-from shapely import wkt
-from shapely.geometry import shape
+from functools import lru_cache
+from typing import Union
+import shapely
+from shapely.errors import GEOSException
 
 
 class Helper:
@@ -13,25 +14,38 @@ class Helper:
             Returns the first occurrence of the matched pattern in text.
         convert_to_wkt(geometry): Convert a geometry (WKT or geoJson) to WKT.
         is_valid_wkt(geometry): Check if the geometry is a valid WKT.
+        is_valid_geometry(geometry): Check if a WKT geometry is non-empty and valid.
+        get_geometry_key(geometry): Returns a normalized key of a WKT geometry.
+        get_centroid_wkt(geometry): Returns the centroid of a WKT geometry as WKT.
 
     """
     @staticmethod
-    def get_matched_str_from_pattern(pattern: str,
+    def get_matched_str_from_pattern(pattern: Union[str, re.Pattern],
                                     text: str) -> str:
         """Returns the first occurence of the matched pattern in text.
 
         Args:
-            pattern : A string representing the regex pattern to look for.
+            pattern : The regex pattern to look for, preferably precompiled.
             text : The text to look into.
 
         Returns:
-            A string representing the first occurence in text of the pattern.
+            A string representing the first occurence in text of the pattern:
+            its first group if it has groups, else the whole match.
+
+        Raises:
+            ValueError: The pattern is not found in text.
 
         """
-        p = re.compile(pattern)
-        return p.findall(text)[0]
+        if isinstance(pattern, str):
+            pattern = re.compile(pattern)
+        # stops at the first occurrence instead of listing all of them
+        match = pattern.search(text)
+        if match is None:
+            raise ValueError(f"Pattern {pattern.pattern!r} not found in {text!r}")
+        return match.group(1 if pattern.groups else 0)
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def convert_to_wkt(geometry):
         """ convert a geometry (WKT or geoJson) to WKT
         Args:
@@ -42,20 +56,14 @@ class Helper:
 
         """
 
+        if Helper.is_valid_wkt(geometry):
+            return geometry
         try:
-            # check if the geometry is a valid WKT
-            return geometry if Helper.is_valid_wkt(geometry) else None
-        except Exception:
-            try:
-                # check if the geometry is a valid geoJson
-                geojson_data = json.loads(geometry)
-                geom = shape(geojson_data)
-                geometry = geom.wkt
-                return geometry
-
-            except ValueError:
-                # geometry is not a valid geoJson
-                return None
+            # check if the geometry is a valid geoJson, parsed by GEOS directly
+            return shapely.from_geojson(geometry).wkt
+        except (GEOSException, TypeError, ValueError):
+            # geometry is not a valid geoJson
+            return None
 
     @staticmethod
     def is_valid_wkt(geometry):
@@ -68,8 +76,57 @@ class Helper:
 
         """
         try:
-            wkt.loads(geometry)
+            shapely.from_wkt(geometry)
             return True
-        except ValueError:
+        except (GEOSException, TypeError, ValueError):
             return False
-        
\ No newline at end of file
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def is_valid_geometry(geometry):
+        """ check if a WKT geometry is non-empty and topologically valid
+        (e.g. not self-intersecting)
+        Args:
+            geometry : A string representing the geometry (WKT)
+
+        Returns:
+            boolean (True/False)
+
+        """
+        try:
+            geom = shapely.from_wkt(geometry)
+        except (GEOSException, TypeError, ValueError):
+            return False
+        return not geom.is_empty and geom.is_valid
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def get_geometry_key(geometry):
+        """ returns a key identifying a WKT geometry regardless of its formatting
+        (whitespaces, number notation), to cache lookups by geometry
+        Args:
+            geometry : A string representing the geometry (WKT)
+
+        Returns:
+            the hexadecimal WKB of the geometry, or the geometry itself
+            if it is not a valid WKT
+
+        """
+        try:
+            return shapely.from_wkt(geometry).wkb_hex
+        except (GEOSException, TypeError, ValueError):
+            return geometry
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def get_centroid_wkt(geometry):
+        """ returns the centroid of a WKT geometry, cached since large polygons
+        are costly to parse again on repeated calls
+        Args:
+            geometry : A string representing the geometry (WKT)
+
+        Returns:
+            the WKT of the geometry's centroid
+
+        """
+        return shapely.from_wkt(geometry).centroid.wkt
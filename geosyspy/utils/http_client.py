@@ -1,23 +1,43 @@
 """ http client class"""
+import logging
+import threading
+import time
 from oauthlib.oauth2 import TokenExpiredError
+from requests.adapters import HTTPAdapter
 from requests_oauthlib import OAuth2Session
+from urllib3.util.retry import Retry
 
 from . import oauth2_client
+from .constants import HTTP_POOL_MAXSIZE, TOKEN_REFRESH_MARGIN
+
+try:
+    import orjson
+except ImportError:  # optional: decodes the large JSON responses faster
+    orjson = None
 
 def renew_access_token(func):
     """Decorator used to wrap the Geosys class's http methods.
 
     This decorator wraps the geosys http methods (get,post...) and checks
-    whether the used token is still valid or not. If not, it fetches a new token and
-    uses it to make another request.
+    whether the used token is still valid or not. The token is refreshed
+    TOKEN_REFRESH_MARGIN seconds before it expires, so that requests do not
+    wait for it; if it has expired anyway, a new token is fetched and the
+    request is made again. Concurrent requests refresh the token only once.
 
     """
 
     def wrapper(self, *args, **kwargs):
+        token = self.access_token
+        if self._token_expires_soon():
+            try:
+                self._refresh_access_token(token)
+            except Exception as e:  # the token is still valid: keep using it
+                logging.getLogger(__name__).warning(e)
+            token = self.access_token
         try:
             return func(self, *args, **kwargs)
         except TokenExpiredError:
-            self.access_token = self.__client_oauth.get_refresh_token()
+            self._refresh_access_token(token)
             return func(self, *args, **kwargs)
 
     return wrapper
@@ -30,6 +50,8 @@ class HttpClient:
         post(url_endpoint, payload): Posts payload to the url_endpoint.
         patch(url_endpoint, payload): Patches payload to the url_endpoint.
         get_access_token(): Returns the access token.
+        json(response): Decodes the JSON body of a response.
+        close(): Closes the pooled connections.
 
     """
     def __init__(
@@ -52,9 +74,19 @@ class HttpClient:
             bearer_token=bearer_token
         )
         self.access_token = self.__client_oauth.token
+        self.__token_lock = threading.Lock()
                 
         self.__client = OAuth2Session(self.__client_oauth.client_id,
                                     token=self.__client_oauth.token)
+        # The session is shared by all the services, possibly from several
+        # threads: keep enough connections alive to reuse them across calls.
+        # Failed connections are retried with a short backoff; urllib3 only
+        # retries reads for idempotent methods, so launches are never posted twice.
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_MAXSIZE,
+                              pool_maxsize=HTTP_POOL_MAXSIZE,
+                              max_retries=Retry(total=3, backoff_factor=0.3))
+        self.__client.mount("https://", adapter)
+        self.__client.mount("http://", adapter)
 
     @renew_access_token
     def get(self, url_endpoint: str, headers=None, verify_ssl = True):
@@ -71,19 +103,20 @@ class HttpClient:
         return self.__client.get(url_endpoint, headers=headers, verify=verify_ssl)
 
     @renew_access_token
-    def post(self, url_endpoint: str, payload: dict, headers=None, verify_ssl = True):
+    def post(self, url_endpoint: str, payload: dict, headers=None, verify_ssl = True, stream = False):
         """Posts payload to the url_endpoint.
 
         Args:
             url_endpoint : A string representing the url to post paylaod to.
             payload : A python dict representing the payload.
+            stream : If True, the response body is not downloaded immediately.
 
         Returns:
             A response object.
         """
         if headers is None:
             headers = {}
-        return self.__client.post(url_endpoint, json=payload, headers=headers, verify=verify_ssl)
+        return self.__client.post(url_endpoint, json=payload, headers=headers, verify=verify_ssl, stream=stream)
 
     @renew_access_token
     def patch(self, url_endpoint: str, payload: dict, verify_ssl = True):
@@ -98,6 +131,28 @@ class HttpClient:
         """
         return self.__client.patch(url_endpoint, json=payload, verify=verify_ssl)
 
+    def _token_expires_soon(self):
+        """Returns True if the token can be refreshed and expires within
+        TOKEN_REFRESH_MARGIN seconds."""
+        token = self.access_token
+        return (
+            bool(token)
+            and "refresh_token" in token
+            and "expires_at" in token
+            and time.time() >= token["expires_at"] - TOKEN_REFRESH_MARGIN
+        )
+
+    def _refresh_access_token(self, token):
+        """Fetches a new token and authenticates the next requests with it,
+        unless another thread has already replaced the given token."""
+        with self.__token_lock:
+            if self.access_token is not token:
+                return
+            new_token = self.__client_oauth.get_refresh_token()
+            self.__client_oauth.token = new_token
+            self.__client.token = new_token
+            self.access_token = new_token
+
     def get_access_token(self):
         """Returns the access token.
 
@@ -105,3 +160,25 @@ class HttpClient:
             The access token.
         """
         return self.access_token
+
+    @staticmethod
+    def json(response):
+        """Decodes the JSON body of a response, with orjson if it is installed.
+
+        Args:
+            response : A response object.
+
+        Returns:
+            The decoded JSON body.
+        """
+        if orjson is not None:
+            try:
+                return orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                # not strict JSON (NaN...) or not UTF-8: let requests decode it
+                pass
+        return response.json()
+
+    def close(self):
+        """Closes the pooled connections of the underlying session."""
+        self.__client.close()
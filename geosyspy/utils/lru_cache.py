@@ -0,0 +1,76 @@
+""" LRU cache class"""
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    """A thread-safe mapping holding at most `maxsize` entries: once full,
+    the least recently used entry is evicted when a new one is added.
+
+    Methods:
+        get(key, default): Returns the value of key, or default if not cached.
+        set(key, value): Caches value under key.
+        pop(key, default): Removes key and returns its value, or default.
+        clear(): Removes all the entries.
+
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize: int = maxsize
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Returns the value cached under key, or default if there is none.
+
+        Args:
+            key : The key to look up.
+            default : The value to return if key is not cached.
+
+        Returns:
+            The cached value or default.
+        """
+        with self._lock:
+            if key not in self._entries:
+                return default
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def set(self, key, value):
+        """Caches value under key, evicting the least recently used entry if full.
+
+        Args:
+            key : The key to cache the value under.
+            value : The value to cache.
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key, default=None):
+        """Removes key from the cache.
+
+        Args:
+            key : The key to remove.
+            default : The value to return if key is not cached.
+
+        Returns:
+            The removed value or default.
+        """
+        with self._lock:
+            return self._entries.pop(key, default)
+
+    def clear(self):
+        """Removes all the entries of the cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
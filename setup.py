@@ -25,5 +25,6 @@ setup(
     packages=find_packages(),
     include_package_data=True,
     data_files=[('', ['VERSION.txt'])],
-    install_requires=["requests", "requests-oauthlib", "oauthlib", "scipy", "pandas", "shapely", "rasterio", "xarray", "retrying"]
+    install_requires=["requests", "requests-oauthlib", "oauthlib", "scipy", "pandas>=2.0", "shapely>=2.0", "rasterio", "xarray", "tenacity"],
+    extras_require={"dask": ["dask"], "zarr": ["zarr"], "orjson": ["orjson"]},
 )
\ No newline at end of file
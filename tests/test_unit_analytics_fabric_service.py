@@ -71,6 +71,13 @@ class TestAnalyticsFabricService:
         result = self.service.push_metrics(season_field_id='seasonfieldFakeId', schema_id='HISTORICAL_HARVEST', values=data)
 
         assert result == 200
+        payload = patch_response.call_args.args[1]
+        assert payload == [{
+            "Entity": {"TypedId": "SeasonField:seasonfieldFakeId"},
+            "Schema": {"Id": "HISTORICAL_HARVEST", "Version": 1},
+            "Timestamp": "2022-01-01",
+            "Values": {"NDVI": 0.5},
+        }]
 
     @patch('geosyspy.utils.http_client.HttpClient.post')
     def test_create_schema(self, get_response):
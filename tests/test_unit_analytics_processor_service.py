@@ -1,5 +1,11 @@
+import asyncio
+import threading
+import time
 from unittest.mock import patch
 
+import pytest
+import tenacity
+
 from geosyspy.services.analytics_processor_service import AnalyticsProcessorService
 from geosyspy.utils.constants import *
 from geosyspy.utils.http_client import *
@@ -26,6 +32,26 @@ class TestAnalyticsProcessorService:
         task_status = self.service.wait_and_check_task_status("task_id")
         assert task_status == "Ended"
 
+    @patch('geosyspy.utils.http_client.HttpClient.get')
+    def test_await_task_status(self, get_response):
+        get_response.return_value = mock_http_response_text_content("GET", load_data_from_textfile(
+            "processor_event_data_mock_http_response"))
+
+        task_status = asyncio.run(self.service.await_task_status("task_id"))
+        assert task_status == "Ended"
+
+    @patch('geosyspy.utils.http_client.HttpClient.get')
+    def test_await_task_status_shared_poll(self, get_response):
+        get_response.return_value = mock_http_response_text_content("GET", load_data_from_textfile(
+            "processor_event_data_mock_http_response"))
+
+        async def await_twice():
+            return await asyncio.gather(self.service.await_task_status("task_id"),
+                                        self.service.await_task_status("task_id"))
+
+        assert asyncio.run(await_twice()) == ["Ended", "Ended"]
+        assert get_response.call_count == 1
+
     @patch('geosyspy.utils.http_client.HttpClient.post')
     def test_get_launch_planted_area_processor(self, post_response):
         post_response.return_value = mock_http_response_text_content("POST", load_data_from_textfile(
@@ -34,6 +60,60 @@ class TestAnalyticsProcessorService:
         task_id = self.service.launch_planted_area_processor(start_date='2020-01-01', end_date='2021-01-01', seasonfield_id= 'seasonfieldFakeId')
         assert task_id == "cb58faaf8a5640e4913d16bfde3f5bbf"
 
+    @patch('geosyspy.utils.http_client.HttpClient.post')
+    def test_launch_processor_shared_in_flight(self, post_response):
+        response = mock_http_response_text_content("POST", load_data_from_textfile(
+            "launch_processor_data_mock_http_response"))
+        posted = threading.Event()
+
+        def slow_post(*args, **kwargs):
+            posted.set()
+            time.sleep(0.2)
+            return response
+
+        post_response.side_effect = slow_post
+
+        async def launch_twice():
+            first = asyncio.create_task(asyncio.to_thread(
+                self.service.launch_planted_area_processor, '2020-01-01', '2021-01-01', 'seasonfieldFakeId'))
+            await asyncio.to_thread(posted.wait)
+            second = asyncio.to_thread(
+                self.service.launch_planted_area_processor, '2020-01-01', '2021-01-01', 'seasonfieldFakeId')
+            return await asyncio.gather(first, second)
+
+        assert asyncio.run(launch_twice()) == ["cb58faaf8a5640e4913d16bfde3f5bbf"] * 2
+        assert post_response.call_count == 1
+
+        # a launch made once the first one has completed creates a new task
+        self.service.launch_planted_area_processor('2020-01-01', '2021-01-01', 'seasonfieldFakeId')
+        assert post_response.call_count == 2
+
+    @patch('geosyspy.utils.http_client.HttpClient.post')
+    def test_launch_processor_shared_in_flight_error(self, post_response):
+        response = mock_http_response_text_content("POST", "", status_code=500)
+        posted = threading.Event()
+
+        def slow_post(*args, **kwargs):
+            posted.set()
+            time.sleep(0.2)
+            return response
+
+        post_response.side_effect = slow_post
+
+        async def launch_twice():
+            first = asyncio.create_task(asyncio.to_thread(
+                self.service.launch_planted_area_processor, '2020-01-01', '2021-01-01', 'seasonfieldFakeId'))
+            await asyncio.to_thread(posted.wait)
+            second = asyncio.to_thread(
+                self.service.launch_planted_area_processor, '2020-01-01', '2021-01-01', 'seasonfieldFakeId')
+            return await asyncio.gather(first, second, return_exceptions=True)
+
+        errors = asyncio.run(launch_twice())
+        assert all(isinstance(error, ValueError) for error in errors)
+        assert post_response.call_count == 1
+        # the failed launch is not shared with the next ones
+        assert not self.service._launches
+
     @patch('geosyspy.utils.http_client.HttpClient.post')
     def test_get_launch_zarc_processor(self, post_response):
         post_response.return_value = mock_http_response_text_content("POST", load_data_from_textfile(
@@ -159,4 +239,28 @@ class TestAnalyticsProcessorService:
         s3_path = self.service.get_s3_path_from_task_and_processor(task_id="4d0980e07b7245d49419ff5ec87fff09",
                                                                    processor_name="mrts")
 
-        assert s3_path == "s3://geosys-geosys-us/2tKecZgMyEP6EkddLxa1gV/mrts/4d0980e07b7245d49419ff5ec87fff09"
\ No newline at end of file
+        assert s3_path == "s3://geosys-geosys-us/2tKecZgMyEP6EkddLxa1gV/mrts/4d0980e07b7245d49419ff5ec87fff09"
+
+    @patch.object(AnalyticsProcessorService.get_s3_path_from_task_and_processor.retry, "wait", tenacity.wait_none())
+    @patch('geosyspy.utils.http_client.HttpClient.get')
+    def test_get_s3_path_from_task_and_processor_not_published_yet(self, get_response):
+        get_response.side_effect = [
+            mock_http_response_text_content("POST", "", status_code=404),
+            mock_http_response_text_content("GET", load_data_from_textfile(
+                "processor_event_data_mock_http_response")),
+        ]
+
+        s3_path = self.service.get_s3_path_from_task_and_processor(task_id="4d0980e07b7245d49419ff5ec87fff09",
+                                                                   processor_name="mrts")
+
+        assert get_response.call_count == 2
+        assert s3_path == "s3://geosys-geosys-us/2tKecZgMyEP6EkddLxa1gV/mrts/4d0980e07b7245d49419ff5ec87fff09"
+
+    @patch('geosyspy.utils.http_client.HttpClient.get')
+    def test_get_s3_path_from_task_and_processor_error(self, get_response):
+        get_response.return_value = mock_http_response_text_content("POST", "Forbidden", status_code=403)
+
+        with pytest.raises(ValueError):
+            self.service.get_s3_path_from_task_and_processor(task_id="4d0980e07b7245d49419ff5ec87fff09",
+                                                             processor_name="mrts")
+        assert get_response.call_count == 1
\ No newline at end of file
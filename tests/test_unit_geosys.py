@@ -1,9 +1,16 @@
 from datetime import datetime
 from unittest.mock import patch
 from geosyspy import Geosys
+from geosyspy.analytics_request import AnalyticsRequest, AnalyticsTask
 from dotenv import load_dotenv
+import asyncio
 import datetime as dt
+import json
 import numpy as np
+import pandas as pd
+import pytest
+import threading
+from requests import HTTPError
 from geosyspy.utils.constants import *
 from tests.test_helper import *
 
@@ -19,6 +26,25 @@ API_PASSWORD = os.getenv("API_PASSWORD")
 POLYGON = "POLYGON((-91.29152885756007 40.39177489815265,-91.28403789132507 40.391776131485386,-91.28386736508233 " \
           "40.389390758655935,-91.29143832829979 40.38874592864832,-91.29152885756007 40.39177489815265))"
 
+MOCK_RESPONSE_LOCK = threading.Lock()
+
+
+def mock_coverage_and_tiff_posts(coverage):
+    """Answers the coverage request with `coverage` and every tiff download
+    with the mocked reflectance map."""
+    tiff_zip = load_binary_data_from_zipfile("Refletance_map_mock.tiff.zip")
+
+    def post(url, *args, **kwargs):
+        # the mocked responses are built one at a time: each one patches
+        # requests globally while the download workers call it concurrently
+        with MOCK_RESPONSE_LOCK:
+            if "catalog-imagery" in url:
+                return mock_http_response_text_content("POST", coverage)
+            return mock_http_response_binary_content("GET", tiff_zip)
+
+    return post
+
+
 class TestGeosys:
     client = Geosys(API_CLIENT_ID,
                     API_CLIENT_SECRET,
@@ -88,6 +114,63 @@ class TestGeosys:
                 "2023-03-26T00:00:00Z", "2023-04-27T00:00:00Z", "2023-05-02T00:00:00Z"}.issubset(set(df.index))
         assert df.index.name == "date"
 
+    @patch('geosyspy.utils.http_client.HttpClient.get')
+    def test_aget_time_series(self, get_response):
+        weather = load_data_from_textfile("time_series_weather_historical_daily_mock_http_response")
+
+        def get(*args, **kwargs):
+            with MOCK_RESPONSE_LOCK:
+                return mock_http_response_text_content("GET", weather)
+
+        get_response.side_effect = get
+        start_date = dt.datetime.strptime("2021-01-01", "%Y-%m-%d")
+        end_date = dt.datetime.strptime("2022-01-01", "%Y-%m-%d")
+
+        async def get_all():
+            return await asyncio.gather(*(
+                self.client.aget_time_series(start_date, end_date, WeatherTypeCollection.WEATHER_HISTORICAL_DAILY,
+                                             [indicator, "Date", "Location"], polygon=POLYGON)
+                for indicator in ("Precipitation", "Temperature")
+            ))
+
+        dfs = asyncio.run(get_all())
+
+        assert len(dfs) == 2
+        assert get_response.call_count == 2
+        assert all("precipitation.cumulative" in df.columns for df in dfs)
+
+    @patch('geosyspy.utils.http_client.HttpClient.get')
+    def test_get_sfid_from_geometry(self, get_response):
+        get_response.return_value = mock_http_response_text_content("GET", load_data_from_textfile(
+            "master_data_management_retrieve_sfids_mock_http_response"))
+
+        ids = self.client.get_sfid_from_geometry(POLYGON)
+
+        assert ids[0] == "2al7w1w"
+
+    @patch('geosyspy.services.vegetation_time_series_service.VegetationTimeSeriesService.get_modis_time_series')
+    @patch('geosyspy.services.master_data_management_service.MasterDataManagementService.extract_season_field_id')
+    def test_get_time_series_batch(self, extract_season_field_id, get_modis_time_series):
+        extract_season_field_id.return_value = "sf_id_123"
+        get_modis_time_series.side_effect = lambda sf_id, start, end, indicator: pd.DataFrame(
+            {"value": [1.0]}, index=pd.Index([indicator], name="date"))
+        start_date = dt.datetime.strptime("2021-01-01", "%Y-%m-%d")
+        end_date = dt.datetime.strptime("2022-01-01", "%Y-%m-%d")
+
+        dfs = self.client.get_time_series_batch(start_date, end_date, SatelliteImageryCollection.MODIS,
+                                                ["NDVI", "EVI", "NDVI"], polygon=POLYGON)
+
+        assert list(dfs) == ["NDVI", "EVI"]
+        assert dfs["EVI"].index[0] == "EVI"
+        extract_season_field_id.assert_called_once_with(POLYGON)
+        assert get_modis_time_series.call_count == 2
+        assert {call.args[0] for call in get_modis_time_series.call_args_list} == {"sf_id_123"}
+
+        with pytest.raises(ValueError):
+            self.client.get_time_series_batch(start_date, end_date,
+                                              WeatherTypeCollection.WEATHER_HISTORICAL_DAILY,
+                                              ["Precipitation"], polygon=POLYGON)
+
     @patch('geosyspy.utils.http_client.HttpClient.get')
     def test_get_time_series_weather_forecast_daily(self, get_response):
         get_response.return_value = mock_http_response_text_content("GET", load_data_from_textfile(
@@ -116,24 +199,170 @@ class TestGeosys:
         assert df.index.name == "date"
         assert df["weatherType"].iloc[1] == "FORECAST_DAILY"
 
-    @patch('geosyspy.utils.http_client.HttpClient.get')
-    def test_get_satellite_image_time_series(self, get_response):
-        fake_get_tiff_zip_response =  mock_http_response_binary_content("GET", load_binary_data_from_zipfile("Refletance_map_mock.tiff.zip"))
-        fake_image_time_series_response =  mock_http_response_text_content("GET", load_data_from_textfile(
-           "satellite_image_time_series_landsat8_mock_http_response"))
-        get_response.side_effect= [fake_image_time_series_response, fake_get_tiff_zip_response, fake_get_tiff_zip_response]
+    @patch('geosyspy.utils.http_client.HttpClient.post')
+    def test_get_satellite_image_time_series(self, post_response):
+        post_response.side_effect = mock_coverage_and_tiff_posts(load_data_from_textfile(
+            "satellite_image_time_series_landsat8_mock_http_response"))
         start_date = dt.datetime.strptime("2022-05-01", "%Y-%m-%d")
         end_date = dt.datetime.strptime("2023-04-28", "%Y-%m-%d")
-        dataset = self.client.get_satellite_image_time_series(            
+        dataset = self.client.get_satellite_image_time_series(
             start_date,
             end_date,
             collections=[SatelliteImageryCollection.SENTINEL_2, SatelliteImageryCollection.LANDSAT_8],
             indicators=["Reflectance"],
             polygon=POLYGON
         )
-        #assert dict(dataset.dims) == {'band': 7, 'y': 13, 'x': 24, 'time': 10}
-        assert all(key in dataset for key in ['band', 'x', 'y', 'time'])
 
+        assert post_response.call_count == 3
+        assert dict(dataset.sizes) == {"time": 2, "band": 4, "y": 80, "x": 81}
+        assert list(dataset["band"].values) == ["Blue", "Green", "Red", "Nir"]
+        assert list(dataset["image.sensor"].values) == ["LANDSAT_8", "LANDSAT_8"]
+        assert dataset["reflectance"].dtype == np.float64
+        # both images have the same grid: the second one is warped onto itself
+        first, second = dataset["reflectance"].values
+        assert np.allclose(first, second, equal_nan=True)
+
+    @patch('geosyspy.utils.http_client.HttpClient.post')
+    def test_get_satellite_image_time_series_different_bands(self, post_response):
+        coverage = json.loads(load_data_from_textfile("satellite_image_time_series_landsat8_mock_http_response"))
+        coverage[1]["image"].update({"date": "2022-05-02", "availableBands": ["Green", "Red", "Nir", "Swir"]})
+        post_response.side_effect = mock_coverage_and_tiff_posts(json.dumps(coverage))
+
+        dataset = self.client.get_satellite_image_time_series(
+            dt.datetime(2022, 5, 1),
+            dt.datetime(2023, 4, 28),
+            collections=[SatelliteImageryCollection.LANDSAT_8],
+            indicators=["Reflectance"],
+            polygon=POLYGON,
+        )
+
+        assert list(dataset["band"].values) == ["Blue", "Green", "Nir", "Red", "Swir"]
+        # the bands an image does not have are filled with NaN
+        assert np.isnan(dataset["reflectance"].sel(band="Blue").isel(time=0)).all()
+        assert np.isnan(dataset["reflectance"].sel(band="Swir").isel(time=1)).all()
+        assert not np.isnan(dataset["reflectance"].sel(band="Green")).all()
+
+    @patch('geosyspy.utils.http_client.HttpClient.post')
+    def test_get_satellite_image_time_series_missing_resolution(self, post_response):
+        coverage = json.loads(load_data_from_textfile("satellite_image_time_series_landsat8_mock_http_response"))
+        # a date with an image of unknown resolution beside a known one, and
+        # a date whose only image has an unknown resolution
+        duplicate = json.loads(json.dumps(coverage[0]))
+        duplicate["image"].update({"id": "landsat-c2l2-sr|no_resolution", "spatialResolution": None})
+        coverage[1]["image"]["spatialResolution"] = None
+        post_response.side_effect = mock_coverage_and_tiff_posts(json.dumps([duplicate, *coverage]))
+
+        dataset = self.client.get_satellite_image_time_series(
+            dt.datetime(2022, 5, 1),
+            dt.datetime(2023, 4, 28),
+            collections=[SatelliteImageryCollection.LANDSAT_8],
+            indicators=["Reflectance"],
+            polygon=POLYGON,
+        )
+
+        assert list(dataset["image.id"].values) == [coverage[0]["image"]["id"], coverage[1]["image"]["id"]]
+        assert dataset["image.spatialResolution"].values[0] == 30.0
+        assert np.isnan(dataset["image.spatialResolution"].values[1])
+
+    @patch('geosyspy.utils.http_client.HttpClient.post')
+    def test_get_satellite_image_time_series_first_image_error(self, post_response):
+        coverage = load_data_from_textfile("satellite_image_time_series_landsat8_mock_http_response")
+        first_image_id = min(json.loads(coverage), key=lambda reference: reference["image"]["date"])["image"]["id"]
+        mock_posts = mock_coverage_and_tiff_posts(coverage)
+
+        def post(url, payload=None, *args, **kwargs):
+            if payload and payload.get("image", {}).get("id") == first_image_id:
+                with MOCK_RESPONSE_LOCK:
+                    return mock_http_response_text_content("POST", "", status_code=500)
+            return mock_posts(url, payload, *args, **kwargs)
+
+        post_response.side_effect = post
+
+        # the other images' workers do not wait forever for the first image's grid
+        with pytest.raises(HTTPError):
+            self.client.get_satellite_image_time_series(
+                dt.datetime(2022, 5, 1),
+                dt.datetime(2023, 4, 28),
+                collections=[SatelliteImageryCollection.LANDSAT_8],
+                indicators=["Reflectance"],
+                polygon=POLYGON,
+            )
+
+    @patch('geosyspy.utils.http_client.HttpClient.post')
+    def test_get_satellite_image_time_series_chunks(self, post_response):
+        post_response.side_effect = mock_coverage_and_tiff_posts(load_data_from_textfile(
+            "satellite_image_time_series_landsat8_mock_http_response"))
+        dataset = self.client.get_satellite_image_time_series(
+            dt.datetime(2022, 5, 1),
+            dt.datetime(2023, 4, 28),
+            collections=[SatelliteImageryCollection.LANDSAT_8],
+            indicators=["Reflectance"],
+            polygon=POLYGON,
+            chunks={"x": 40, "y": 40},
+        )
+
+        assert dataset["reflectance"].chunks is not None
+        assert dataset["reflectance"].data.chunksize == (2, 4, 40, 40)
+        assert dict(dataset.sizes) == {"time": 2, "band": 4, "y": 80, "x": 81}
+
+    @patch('geosyspy.utils.http_client.HttpClient.post')
+    def test_get_satellite_image_time_series_output_zarr(self, post_response, tmp_path):
+        coverage = json.loads(load_data_from_textfile("satellite_image_time_series_landsat8_mock_http_response"))
+        coverage[1]["image"].update({"id": "sentinel-2-l2a|S2B_15TXE_20231117_0_L2A_with_a_longer_image_id",
+                                     "sensor": "SENTINEL_2"})
+        post_response.side_effect = mock_coverage_and_tiff_posts(json.dumps(coverage))
+
+        dataset = self.client.get_satellite_image_time_series(
+            dt.datetime(2022, 5, 1),
+            dt.datetime(2023, 4, 28),
+            collections=[SatelliteImageryCollection.SENTINEL_2, SatelliteImageryCollection.LANDSAT_8],
+            indicators=["Reflectance"],
+            polygon=POLYGON,
+            output_zarr=str(tmp_path / "images.zarr"),
+        )
+
+        assert dict(dataset.sizes) == {"time": 2, "band": 4, "y": 80, "x": 81}
+        assert set(dataset["image.sensor"].values) == {"LANDSAT_8", "SENTINEL_2"}
+        assert "sentinel-2-l2a|S2B_15TXE_20231117_0_L2A_with_a_longer_image_id" in dataset["image.id"].values
+        assert dataset["reflectance"].dtype == np.float64
+
+    @patch('geosyspy.utils.http_client.HttpClient.post')
+    def test_get_satellite_image_time_series_output_zarr_different_bands(self, post_response, tmp_path):
+        coverage = json.loads(load_data_from_textfile("satellite_image_time_series_landsat8_mock_http_response"))
+        coverage[1]["image"].update({"date": "2022-05-02", "availableBands": ["Green", "Red", "Nir", "Swir"]})
+        post_response.side_effect = mock_coverage_and_tiff_posts(json.dumps(coverage))
+
+        dataset = self.client.get_satellite_image_time_series(
+            dt.datetime(2022, 5, 1),
+            dt.datetime(2023, 4, 28),
+            collections=[SatelliteImageryCollection.LANDSAT_8],
+            indicators=["Reflectance"],
+            polygon=POLYGON,
+            output_zarr=str(tmp_path / "images.zarr"),
+        )
+        in_memory = self.client.get_satellite_image_time_series(
+            dt.datetime(2022, 5, 1),
+            dt.datetime(2023, 4, 28),
+            collections=[SatelliteImageryCollection.LANDSAT_8],
+            indicators=["Reflectance"],
+            polygon=POLYGON,
+        )
+
+        assert list(dataset["band"].values) == ["Blue", "Green", "Nir", "Red", "Swir"]
+        # the bands an image does not have are filled with NaN in the store too
+        assert np.isnan(dataset["reflectance"].sel(band="Blue").isel(time=0)).all()
+        assert np.isnan(dataset["reflectance"].sel(band="Swir").isel(time=1)).all()
+        assert np.allclose(dataset["reflectance"].values, in_memory["reflectance"].values, equal_nan=True)
+
+    @patch('geosyspy.services.map_product_service.MapProductService.get_satellite_coverage')
+    def test_get_satellite_coverage_image_references_empty(self, get_satellite_coverage):
+        get_satellite_coverage.return_value = pd.json_normalize([])
+
+        df, images_references = self.client.get_satellite_coverage_image_references(
+            dt.datetime(2022, 5, 1), dt.datetime(2023, 4, 28), polygon=POLYGON)
+
+        assert df.empty
+        assert images_references == {}
 
     @patch('geosyspy.utils.http_client.HttpClient.post')
     def test_get_agriquest_weather_block_data(self, get_response):
@@ -162,3 +391,183 @@ class TestGeosys:
         )
         assert dataset.keys()[0] == "AMU"
         assert dataset.keys()[-1] == "NDVI"
+
+    @patch('geosyspy.utils.http_client.HttpClient.post')
+    def test_download_images(self, post_response, tmp_path):
+        post_response.return_value = mock_http_response_binary_content("GET", load_binary_data_from_zipfile(
+            "Refletance_map_mock.tiff.zip"))
+        image_ids = ["sentinel-2-l2a|S2B_15TXE_20240412_0_L2A", "landsat-c2l2-sr|LC08_L2SP_024032_20231212"]
+
+        self.client.download_images(POLYGON, image_ids, "NDVI", str(tmp_path))
+
+        assert post_response.call_count == 2
+        assert {"image_sentinel-2-l2a_S2B_15TXE_20240412_0_L2A_tiff.zip",
+                "image_landsat-c2l2-sr_LC08_L2SP_024032_20231212_tiff.zip"} == {f.name for f in tmp_path.iterdir()}
+        assert all(f.read_bytes() == load_binary_data_from_zipfile("Refletance_map_mock.tiff.zip")
+                   for f in tmp_path.iterdir())
+
+    @patch('geosyspy.services.analytics_fabric_service.AnalyticsFabricService.get_lastest_metrics')
+    @patch('geosyspy.services.analytics_processor_service.AnalyticsProcessorService.await_task_status')
+    @patch('geosyspy.services.analytics_processor_service.AnalyticsProcessorService.launch_greenness_processor')
+    @patch('geosyspy.services.analytics_processor_service.AnalyticsProcessorService.launch_planted_area_processor')
+    @patch('geosyspy.services.master_data_management_service.MasterDataManagementService.get_season_field_unique_id')
+    @patch('geosyspy.services.master_data_management_service.MasterDataManagementService.create_season_field_id')
+    def test_run_analytics_batch(self, create_season_field_id, get_season_field_unique_id,
+                                 launch_planted_area_processor, launch_greenness_processor,
+                                 await_task_status, get_lastest_metrics):
+        create_season_field_id.return_value = mock_http_response_text_content("POST", '{"id": "fakeSeasonFieldId"}',
+                                                                              status_code=201)
+        get_season_field_unique_id.return_value = "fakeUniqueId"
+        launch_planted_area_processor.return_value = "planted_area_task_id"
+        launch_greenness_processor.return_value = "greenness_task_id"
+        await_task_status.return_value = "Ended"
+        get_lastest_metrics.side_effect = lambda sf_unique_id, schema: schema
+
+        self.client.clear_cache()
+        results = self.client.run_analytics_batch([
+            AnalyticsRequest("planted_area", {"start_date": "2023-01-01", "end_date": "2023-06-01"}, POLYGON),
+            AnalyticsRequest("greenness", {"start_date": "2023-01-01", "end_date": "2023-06-01",
+                                           "sowing_date": "2023-03-01", "crop": Enum("CropEnum", {"CORN": "CORN"}).CORN},
+                            POLYGON),
+        ])
+
+        assert results == ["PLANTED_AREA", "GREENNESS"]
+        assert create_season_field_id.call_count == 1
+        assert {call.args[0] for call in await_task_status.call_args_list} == {"planted_area_task_id",
+                                                                               "greenness_task_id"}
+
+    @patch('geosyspy.services.analytics_fabric_service.AnalyticsFabricService.get_lastest_metrics')
+    @patch('geosyspy.services.analytics_processor_service.AnalyticsProcessorService.wait_and_check_task_status')
+    @patch('geosyspy.services.analytics_processor_service.AnalyticsProcessorService.launch_planted_area_processor')
+    @patch('geosyspy.services.master_data_management_service.MasterDataManagementService.get_season_field_unique_id')
+    @patch('geosyspy.services.master_data_management_service.MasterDataManagementService.create_season_field_id')
+    def test_launch_analytics(self, create_season_field_id, get_season_field_unique_id,
+                              launch_planted_area_processor, wait_and_check_task_status,
+                              get_lastest_metrics):
+        create_season_field_id.return_value = mock_http_response_text_content("POST", '{"id": "fakeSeasonFieldId"}',
+                                                                              status_code=201)
+        get_season_field_unique_id.return_value = "fakeUniqueId"
+        launch_planted_area_processor.return_value = "planted_area_task_id"
+        wait_and_check_task_status.return_value = "Ended"
+        get_lastest_metrics.side_effect = lambda sf_unique_id, schema: schema
+
+        self.client.clear_cache()
+        task = self.client.launch_analytics(
+            AnalyticsRequest("planted_area", {"start_date": "2023-01-01", "end_date": "2023-06-01"}, POLYGON))
+
+        assert task == AnalyticsTask("planted_area_task_id", "PLANTED_AREA", "fakeUniqueId")
+        assert wait_and_check_task_status.call_count == 0
+        assert self.client.get_analytics_result(task) == "PLANTED_AREA"
+
+    @patch('geosyspy.services.master_data_management_service.MasterDataManagementService.extract_season_field_id')
+    def test_extract_season_field_ids(self, extract_season_field_id):
+        extract_season_field_id.side_effect = lambda polygon: f"sfid_{len(polygon)}"
+        other_polygon = "POLYGON((0 0,1 0,1 1,0 0))"
+
+        season_field_ids = self.client.extract_season_field_ids([POLYGON, other_polygon, POLYGON])
+
+        assert season_field_ids == [f"sfid_{len(POLYGON)}", f"sfid_{len(other_polygon)}", f"sfid_{len(POLYGON)}"]
+        assert extract_season_field_id.call_count == 2
+
+    @patch('geosyspy.utils.http_client.HttpClient.close')
+    def test_context_manager_closes_http_client(self, close):
+        with self.client as client:
+            assert client is self.client
+        close.assert_called_once()
+
+    @patch('geosyspy.services.analytics_processor_service.AnalyticsProcessorService.launch_zarc_processor')
+    @patch('geosyspy.services.gis_service.GisService.get_municipio_id_from_geometry')
+    @patch('geosyspy.services.master_data_management_service.MasterDataManagementService.get_season_field_unique_id')
+    @patch('geosyspy.services.master_data_management_service.MasterDataManagementService.create_season_field_id')
+    def test_get_zarc_analytics_without_municipio(self, create_season_field_id, get_season_field_unique_id,
+                                                  get_municipio_id_from_geometry, launch_zarc_processor):
+        create_season_field_id.return_value = mock_http_response_text_content("POST", '{"id": "fakeSeasonFieldId"}',
+                                                                              status_code=201)
+        get_season_field_unique_id.return_value = "fakeUniqueId"
+        get_municipio_id_from_geometry.return_value = 0
+
+        self.client.clear_cache()
+        with pytest.raises(ValueError, match="No municipio id found"):
+            self.client.get_zarc_analytics("2023-01-01", "2023-06-01", 10,
+                                           Enum("CropEnum", {"SOY": "SOY"}).SOY,
+                                           ZarcSoilType.SOIL_TYPE_1, ZarcCycleType.CYCLE_TYPE_1, POLYGON)
+
+        get_municipio_id_from_geometry.assert_called_once()
+        # the geometry is rejected before its season field is created
+        create_season_field_id.assert_not_called()
+        get_season_field_unique_id.assert_not_called()
+        launch_zarc_processor.assert_not_called()
+
+    @patch('geosyspy.services.analytics_fabric_service.AnalyticsFabricService.get_lastest_metrics')
+    @patch('geosyspy.services.analytics_processor_service.AnalyticsProcessorService.wait_and_check_task_status')
+    def test_get_analytics_result_cache(self, wait_and_check_task_status, get_lastest_metrics):
+        wait_and_check_task_status.return_value = "Ended"
+        get_lastest_metrics.return_value = pd.DataFrame({"Values.Greenness": [0.5]})
+        task = AnalyticsTask("greenness_task_id", "GREENNESS", "fakeUniqueId")
+
+        self.client.clear_cache()
+        first = self.client.get_analytics_result(task)
+        second = self.client.get_analytics_result(task)
+
+        assert first.equals(second)
+        assert first is not second
+        assert wait_and_check_task_status.call_count == 1
+        assert get_lastest_metrics.call_count == 1
+
+        self.client.clear_cache()
+        self.client.get_analytics_result(task)
+        assert get_lastest_metrics.call_count == 2
+
+    @patch('geosyspy.geosys.METRICS_CACHE_MAXSIZE', 2)
+    @patch('geosyspy.services.analytics_fabric_service.AnalyticsFabricService.get_lastest_metrics')
+    @patch('geosyspy.services.analytics_processor_service.AnalyticsProcessorService.wait_and_check_task_status')
+    def test_get_analytics_result_cache_is_bounded(self, wait_and_check_task_status, get_lastest_metrics):
+        wait_and_check_task_status.return_value = "Ended"
+        get_lastest_metrics.return_value = pd.DataFrame({"Values.Greenness": [0.5]})
+        client = Geosys(API_CLIENT_ID, API_CLIENT_SECRET, API_USERNAME, API_PASSWORD, Env.PREPROD, Region.NA)
+
+        for task_id in ("task_1", "task_2", "task_3"):
+            client.get_analytics_result(AnalyticsTask(task_id, "GREENNESS", "fakeUniqueId"))
+
+        assert len(client._metrics_cache) == 2
+        assert ("task_1", "GREENNESS", "fakeUniqueId") not in client._metrics_cache
+
+    @patch('geosyspy.services.analytics_fabric_service.AnalyticsFabricService.get_lastest_metrics')
+    @patch('geosyspy.services.analytics_processor_service.AnalyticsProcessorService.await_task_status')
+    @patch('geosyspy.services.analytics_processor_service.AnalyticsProcessorService.launch_planted_area_processor')
+    @patch('geosyspy.services.master_data_management_service.MasterDataManagementService.get_season_field_unique_id')
+    def test_arun_analytics(self, get_season_field_unique_id, launch_planted_area_processor,
+                            await_task_status, get_lastest_metrics):
+        get_season_field_unique_id.return_value = "fakeUniqueId"
+        launch_planted_area_processor.return_value = "planted_area_task_id"
+        await_task_status.return_value = "Ended"
+        get_lastest_metrics.side_effect = lambda sf_unique_id, schema: schema
+
+        self.client.clear_cache()
+        result = asyncio.run(self.client.arun_analytics(
+            AnalyticsRequest("planted_area", {"start_date": "2023-01-01", "end_date": "2023-06-01"}, POLYGON,
+                             season_field_id="fakeSeasonFieldId")))
+
+        assert result == "PLANTED_AREA"
+        await_task_status.assert_called_once_with("planted_area_task_id")
+
+    @patch('geosyspy.services.analytics_fabric_service.AnalyticsFabricService.get_lastest_metrics')
+    @patch('geosyspy.services.analytics_processor_service.AnalyticsProcessorService.wait_and_check_task_status')
+    @patch('geosyspy.services.analytics_processor_service.AnalyticsProcessorService.launch_harvest_processor')
+    @patch('geosyspy.services.master_data_management_service.MasterDataManagementService.get_season_field_unique_id')
+    def test_get_harvest_analytics(self, get_season_field_unique_id, launch_harvest_processor,
+                                   wait_and_check_task_status, get_lastest_metrics):
+        get_season_field_unique_id.return_value = "fakeUniqueId"
+        launch_harvest_processor.return_value = "harvest_task_id"
+        wait_and_check_task_status.return_value = "Ended"
+        get_lastest_metrics.side_effect = lambda sf_unique_id, schema: schema
+        crop = Enum("CropEnum", {"CORN": "CORN"}).CORN
+
+        self.client.clear_cache()
+        result = self.client.get_harvest_analytics(120, 1, 5, crop, 2023, POLYGON, Harvest.HARVEST_HISTORICAL,
+                                                   season_field_id="fakeSeasonFieldId")
+
+        assert result == "HISTORICAL_HARVEST"
+        launch_harvest_processor.assert_called_once_with(
+            seasonfield_id="fakeUniqueId", season_duration=120, season_start_day=1, season_start_month=5,
+            crop="CORN", year=2023, harvest_type=Harvest.HARVEST_HISTORICAL, geometry=POLYGON)
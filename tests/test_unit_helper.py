@@ -0,0 +1,37 @@
+import pytest
+from geosyspy.utils.helper import Helper
+from geosyspy.utils.constants import SEASON_FIELD_ID_REGEX
+
+wkt = "POLYGON((-91.17523978603823 40.29787117039518,-91.17577285022956 40.29199489606421,-91.167613719932 40.29199489606421,-91.17523978603823 40.29787117039518))"
+geojson = '{"type": "Polygon", "coordinates": [[[-91.17523978603823, 40.29787117039518], [-91.17577285022956, 40.29199489606421], [-91.167613719932, 40.29199489606421], [-91.17523978603823, 40.29787117039518]]]}'
+
+
+class TestHelper:
+
+    def test_convert_to_wkt_from_wkt(self):
+        assert Helper.convert_to_wkt(wkt) == wkt
+
+    def test_convert_to_wkt_from_geojson(self):
+        assert Helper.convert_to_wkt(geojson).startswith("POLYGON ((-91.17523978603823 40.29787117039518")
+
+    def test_convert_to_wkt_invalid_geometry(self):
+        assert Helper.convert_to_wkt("not a geometry") is None
+
+    def test_is_valid_geometry(self):
+        assert Helper.is_valid_geometry(wkt)
+        assert not Helper.is_valid_geometry("POLYGON EMPTY")
+        assert not Helper.is_valid_geometry("POLYGON((0 0,1 1,1 0,0 1,0 0))")
+        assert not Helper.is_valid_geometry("not a geometry")
+
+    def test_get_centroid_wkt(self):
+        assert Helper.get_centroid_wkt("POLYGON((0 0,2 0,2 2,0 2,0 0))") == "POINT (1 1)"
+
+    def test_get_matched_str_from_pattern(self):
+        text = "A season field already exists, Id: fakeSeasonFieldId, for this geometry"
+        assert Helper.get_matched_str_from_pattern(SEASON_FIELD_ID_REGEX, text) == "fakeSeasonFieldId"
+        assert Helper.get_matched_str_from_pattern(r"\sId:\s(\w+),", text) == "fakeSeasonFieldId"
+        assert Helper.get_matched_str_from_pattern(r"Id:\s\w+", text) == "Id: fakeSeasonFieldId"
+
+    def test_get_matched_str_from_pattern_not_found(self):
+        with pytest.raises(ValueError):
+            Helper.get_matched_str_from_pattern(SEASON_FIELD_ID_REGEX, "Invalid sowing date")
@@ -1,5 +1,10 @@
+import math
+import threading
+import time
 from unittest.mock import patch
+from oauthlib.oauth2 import TokenExpiredError
 from geosyspy.utils.http_client import *
+from tests.test_helper import mock_http_response_text_content
 
 
 
@@ -54,3 +59,102 @@ def test_patch_request_should_success(patch_response):
     response = client.patch(url_endpoint="http://geosys.com", payload=payload)
     assert client.patch.call_count == 1
     assert response == "HTTP 200 OK"
+
+
+def test_json_should_decode_response():
+    response = mock_http_response_text_content("GET", '[{"id": "abc", "value": 0.5}]')
+
+    assert HttpClient.json(response) == [{"id": "abc", "value": 0.5}]
+
+
+@patch('geosyspy.utils.http_client.orjson', None)
+def test_json_should_decode_response_without_orjson():
+    response = mock_http_response_text_content("GET", '[{"id": "abc", "value": 0.5}]')
+
+    assert HttpClient.json(response) == [{"id": "abc", "value": 0.5}]
+
+
+def test_json_should_decode_non_strict_response():
+    response = mock_http_response_text_content("GET", '{"value": NaN}')
+
+    assert math.isnan(HttpClient.json(response)["value"])
+
+
+@patch('requests_oauthlib.OAuth2Session.get')
+@patch('geosyspy.utils.oauth2_client.Oauth2Api.get_refresh_token')
+def test_get_should_renew_expired_token(get_refresh_token, session_get):
+    new_token = {"access_token": "new_token", "refresh_token": "refresh_123",
+                 "expires_at": time.time() + 3600}
+    get_refresh_token.return_value = new_token
+    session_get.side_effect = [TokenExpiredError(), "HTTP 200 OK"]
+    client = HttpClient("client_id_123",
+                        "client_secret_123456",
+                        "username_123",
+                        "password_123",
+                        "preprod",
+                        "na")
+
+    response = client.get(url_endpoint="http://geosys.com")
+
+    assert response == "HTTP 200 OK"
+    assert session_get.call_count == 2
+    assert client.get_access_token() == new_token
+    assert client._HttpClient__client.token == new_token
+
+
+@patch('requests_oauthlib.OAuth2Session.get')
+@patch('geosyspy.utils.oauth2_client.Oauth2Api.get_refresh_token')
+def test_get_should_renew_token_before_expiry(get_refresh_token, session_get):
+    new_token = {"access_token": "new_token", "refresh_token": "refresh_123",
+                 "expires_at": time.time() + 3600}
+    get_refresh_token.return_value = new_token
+    session_get.return_value = "HTTP 200 OK"
+    client = HttpClient("client_id_123",
+                        "client_secret_123456",
+                        "username_123",
+                        "password_123",
+                        "preprod",
+                        "na")
+    client.access_token = {"access_token": "old_token", "refresh_token": "refresh_123",
+                           "expires_at": time.time() + 60}
+
+    client.get(url_endpoint="http://geosys.com")
+    client.get(url_endpoint="http://geosys.com")
+
+    assert get_refresh_token.call_count == 1
+    assert session_get.call_count == 2
+    assert client.get_access_token() == new_token
+
+
+@patch('requests_oauthlib.OAuth2Session.get')
+@patch('geosyspy.utils.oauth2_client.Oauth2Api.get_refresh_token')
+def test_concurrent_gets_should_renew_token_once(get_refresh_token, session_get):
+    get_refresh_token.return_value = {"access_token": "new_token", "refresh_token": "refresh_123",
+                                      "expires_at": time.time() + 3600}
+    client = HttpClient("client_id_123",
+                        "client_secret_123456",
+                        "username_123",
+                        "password_123",
+                        "preprod",
+                        "na")
+    client.access_token = {"access_token": "old_token"}
+    # both requests fail with the old token before any of them renews it
+    barrier = threading.Barrier(2, timeout=5)
+
+    def get(*args, **kwargs):
+        if client.access_token["access_token"] == "old_token":
+            barrier.wait()
+            raise TokenExpiredError()
+        return "HTTP 200 OK"
+
+    session_get.side_effect = get
+    responses = []
+    threads = [threading.Thread(target=lambda: responses.append(client.get("http://geosys.com")))
+               for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert responses == ["HTTP 200 OK", "HTTP 200 OK"]
+    assert get_refresh_token.call_count == 1
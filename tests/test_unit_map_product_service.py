@@ -2,8 +2,13 @@ import datetime as dt
 from unittest.mock import patch
 
 import numpy as np
+import pytest
+from requests import HTTPError
 
-from geosyspy.services.map_product_service import MapProductService
+from geosyspy.services.map_product_service import (
+    MapProductService,
+    TransientCoverageError,
+)
 from geosyspy.utils.constants import *
 from geosyspy.utils.http_client import *
 from tests.test_helper import *
@@ -53,3 +58,42 @@ class TestMapProductService:
             "image.date",
             "seasonField.id",
         }.issubset(set(info.columns))
+
+    @patch("geosyspy.utils.http_client.HttpClient.post")
+    def test_get_satellite_coverage_server_error(self, post_response):
+        post_response.return_value = mock_http_response_text_content(
+            "POST", "", status_code=503
+        )
+        start_date = dt.datetime.strptime("2022-01-01", "%Y-%m-%d")
+        end_date = dt.datetime.strptime("2023-01-01", "%Y-%m-%d")
+
+        with pytest.raises(TransientCoverageError):
+            self.service.get_satellite_coverage(
+                "fakeSeasonFieldId", None, start_date, end_date, "NDVI"
+            )
+
+    @patch("geosyspy.utils.http_client.HttpClient.post")
+    def test_get_zipped_tiff_error_closes_response(self, post_response):
+        response = mock_http_response_text_content("POST", "", status_code=500)
+        post_response.return_value = response
+
+        with patch.object(response, "close") as close:
+            with pytest.raises(HTTPError):
+                self.service.get_zipped_tiff(
+                    "fakeSeasonFieldId", None, "fakeImageId", "NDVI", stream=True
+                )
+            close.assert_called_once()
+
+    @patch("geosyspy.utils.http_client.HttpClient.post")
+    def test_get_zipped_tiff_url(self, post_response):
+        post_response.return_value = mock_http_response_text_content("POST", "")
+
+        self.service.get_zipped_tiff("fakeSeasonFieldId", None, "fakeImageId", "ndvi")
+        self.service.get_zipped_tiff("fakeSeasonFieldId", None, "fakeImageId", "")
+
+        ndvi_url = post_response.call_args_list[0].args[0]
+        reflectance_url = post_response.call_args_list[1].args[0]
+        assert ndvi_url.endswith("/NDVI/image.tiff.zip?resolution=Sensor")
+        assert reflectance_url.endswith("/TOC/image.tiff.zip?resolution=Sensor")
+        assert self.service._zipped_tiff_urls == {"NDVI": ndvi_url, "": reflectance_url}
+        assert post_response.call_args.args[2]["Accept-Encoding"] == "identity"
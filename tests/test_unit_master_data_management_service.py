@@ -111,3 +111,45 @@ class TestMasterDataManagementService:
 
         response = self.service.get_profile(fields="unitProfileUnitCategories")
         assert "unitProfileUnitCategories" in response
+
+    @patch("geosyspy.utils.http_client.HttpClient.get")
+    def test_get_season_field_unique_id_cache(self, get_response):
+        get_response.return_value = mock_http_response_text_content(
+            "GET",
+            load_data_from_textfile(
+                "master_data_management_get_unique_id_mock_http_response"
+            ),
+        )
+        service = MasterDataManagementService(
+            base_url=self.url, http_client=self.http_client
+        )
+
+        service.get_season_field_unique_id(season_field_id="fakeSeasonFieldId")
+        response = service.get_season_field_unique_id(
+            season_field_id="fakeSeasonFieldId"
+        )
+        assert response == "4XcGhZvA1OjpO3gUwYM61e"
+        assert get_response.call_count == 1
+
+        service.clear_cache()
+        service.get_season_field_unique_id(season_field_id="fakeSeasonFieldId")
+        assert get_response.call_count == 2
+
+    @patch("geosyspy.utils.http_client.HttpClient.post")
+    def test_extract_season_field_id_cache(self, post_response):
+        post_response.return_value = mock_http_response_text_content(
+            "POST",
+            load_data_from_textfile(
+                "master_data_management_post_extract_id_mock_http_response"
+            ),
+            status_code=201,
+        )
+        service = MasterDataManagementService(
+            base_url=self.url, http_client=self.http_client
+        )
+
+        season_field_id = service.extract_season_field_id(polygon=geometry)
+        # the same polygon, formatted differently, is found in the cache
+        reformatted = geometry.replace("POLYGON((", "POLYGON (( ").replace(",", ", ")
+        assert service.extract_season_field_id(polygon=reformatted) == season_field_id
+        assert post_response.call_count == 1
@@ -34,6 +34,8 @@ class TestVegetationTimeSeriesService:
         date_range = list(map(lambda x: x.strftime("%Y-%m-%d"), df.index))
         assert {"2020-01-01", "2020-01-02", "2020-01-03", "2020-01-04", "2020-01-05", "2020-01-06",
                 "2020-01-07"}.issubset(set(date_range))
+        assert get_response.call_args.args[0].startswith(
+            "https://testurl.com/vegetation-time-series/v1/season-fields/values?")
 
     @patch('geosyspy.utils.http_client.HttpClient.get')
     def test_get_satellite_image_time_series_modis_ndvi(self, get_response):
@@ -49,6 +51,8 @@ class TestVegetationTimeSeriesService:
         assert {"value", "index", "pixel.id"}.issubset(set(df.columns))
         assert np.all((df["index"].values == "NDVI"))
         assert len(df.index) == 14
+        assert get_response.call_args.args[0].startswith(
+            "https://testurl.com/vegetation-time-series/v1/season-fields/pixels/values?")
 
         assert {"2020-01-01", "2020-01-02", "2020-01-03", "2020-01-04", "2020-01-05", "2020-01-06",
                 "2020-01-07"}.issubset(set(df.index))
@@ -56,3 +60,6 @@ class TestVegetationTimeSeriesService:
         assert {"mh11v4i225j4612", "mh11v4i226j4612"}.issubset(set(df["pixel.id"]))
 
 
+        pixel = df[df["pixel.id"] == "mh11v4i225j4612"].iloc[0]
+        assert np.isclose(pixel["X"], -6619580.4372795)
+        assert np.isclose(pixel["Y"], -16635706.39936712)
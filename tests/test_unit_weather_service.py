@@ -1,6 +1,8 @@
 from unittest.mock import patch
 import datetime
+from urllib.parse import parse_qsl, urlsplit
 from geosyspy.services.weather_service import WeatherService
+from geosyspy.utils.helper import Helper
 from geosyspy.utils.http_client import *
 from tests.test_helper import *
 from geosyspy.utils.constants import *
@@ -32,4 +34,36 @@ class TestWeatherService:
         assert data['precipitation.cumulative'][0] == 0.22834645669291338
         assert data['temperature.standard'][0] == 71.47399998282076
 
+        query = dict(parse_qsl(urlsplit(get_response.call_args.args[0]).query))
+        assert query["Location"] == Helper.get_centroid_wkt(geometry)
+        assert query["Date"] == (f"$between:{start_date:%Y-%m-%d}T00:00:00.0000000Z"
+                                 f"|{end_date:%Y-%m-%d}T00:00:00.0000000Z")
+        assert query["$fields"] == "precipitation,temperature,Date"
 
+
+    @patch('geosyspy.utils.http_client.HttpClient.get')
+    def test_get_weather_historical_is_cached(self, get_response):
+        get_response.return_value = mock_http_response_text_content("GET", load_data_from_textfile(
+            "weather_data_mock_http_response"))
+        service = WeatherService(base_url=self.url, http_client=self.http_client)
+        end_date = datetime.datetime(2023, 6, 1)
+        start_date = end_date - datetime.timedelta(days=7)
+
+        data = service.get_weather(polygon=geometry, start_date=start_date, end_date=end_date,
+                                   weather_type=WeatherTypeCollection.WEATHER_HISTORICAL_DAILY,
+                                   fields=['precipitation', 'temperature'])
+        data.drop(data.index, inplace=True)
+        cached = service.get_weather(polygon=geometry, start_date=start_date, end_date=end_date,
+                                     weather_type=WeatherTypeCollection.WEATHER_HISTORICAL_DAILY,
+                                     fields=['precipitation', 'temperature'])
+
+        assert get_response.call_count == 1
+        assert cached.index.__len__() == 6
+
+        service.get_weather(polygon=geometry, start_date=start_date, end_date=end_date,
+                            weather_type=WeatherTypeCollection.WEATHER_FORECAST_DAILY,
+                            fields=['precipitation', 'temperature'])
+        service.get_weather(polygon=geometry, start_date=start_date, end_date=end_date,
+                            weather_type=WeatherTypeCollection.WEATHER_FORECAST_DAILY,
+                            fields=['precipitation', 'temperature'])
+        assert get_response.call_count == 3